@@ -13,108 +13,115 @@ import csv
 from pathlib import Path
 
 # NZ species with eBird codes and bilingual names
-# Format: ebird_code -> (common_name_with_maori, scientific_name)
+# Format: (ebird_code, common_name_with_maori, scientific_name)
 # Codes verified against eBird/Clements v2025 taxonomy
-NZ_SPECIES_TAXONOMY = {
+# Codes are lowercase by convention so they can be checked against the
+# lowercased CSV codes without further normalization
+NZ_SPECIES_TAXONOMY = (
     # Tui and honeyeaters
-    "tui1": ("Tūī", "Prosthemadera novaeseelandiae"),
-    "nezbel1": ("Bellbird / Korimako", "Anthornis melanura"),
+    ("tui1", "Tūī", "Prosthemadera novaeseelandiae"),
+    ("nezbel1", "Bellbird / Korimako", "Anthornis melanura"),
 
     # Fantail - single species, multiple subspecies
-    "nezfan1": ("New Zealand Fantail / Pīwakawaka", "Rhipidura fuliginosa"),
+    ("nezfan1", "New Zealand Fantail / Pīwakawaka", "Rhipidura fuliginosa"),
 
     # Warbler
-    "gryger1": ("Grey Warbler / Riroriro", "Gerygone igata"),
+    ("gryger1", "Grey Warbler / Riroriro", "Gerygone igata"),
 
     # Owl
-    "morepo2": ("Morepork / Ruru", "Ninox novaeseelandiae"),
+    ("morepo2", "Morepork / Ruru", "Ninox novaeseelandiae"),
 
     # Parrots
-    "kea1": ("Kea", "Nestor notabilis"),
-    "nezkak1": ("New Zealand Kākā", "Nestor meridionalis"),
-    "kakapo2": ("Kākāpō", "Strigops habroptilus"),
-    "refpar4": ("Red-crowned Parakeet / Kākāriki", "Cyanoramphus novaezelandiae"),
-    "malpar2": ("Orange-fronted Parakeet / Kākāriki", "Cyanoramphus malherbi"),
+    ("kea1", "Kea", "Nestor notabilis"),
+    ("nezkak1", "New Zealand Kākā", "Nestor meridionalis"),
+    ("kakapo2", "Kākāpō", "Strigops habroptilus"),
+    ("refpar4", "Red-crowned Parakeet / Kākāriki", "Cyanoramphus novaezelandiae"),
+    ("malpar2", "Orange-fronted Parakeet / Kākāriki", "Cyanoramphus malherbi"),
 
     # Kiwi
-    "nibkiw1": ("North Island Brown Kiwi", "Apteryx mantelli"),
+    ("nibkiw1", "North Island Brown Kiwi", "Apteryx mantelli"),
 
     # Kokako
-    "kokako3": ("Kōkako", "Callaeas wilsoni"),
+    ("kokako3", "Kōkako", "Callaeas wilsoni"),
 
     # Pigeons
-    "nezpig2": ("Kererū", "Hemiphaga novaeseelandiae"),
-    "nezpig3": ("Chatham Islands Pigeon / Parea", "Hemiphaga chathamensis"),
+    ("nezpig2", "Kererū", "Hemiphaga novaeseelandiae"),
+    ("nezpig3", "Chatham Islands Pigeon / Parea", "Hemiphaga chathamensis"),
 
     # Falcon
-    "nezfal1": ("New Zealand Falcon / Kārearea", "Falco novaeseelandiae"),
+    ("nezfal1", "New Zealand Falcon / Kārearea", "Falco novaeseelandiae"),
 
     # Robins
-    "nezrob2": ("North Island Robin / Toutouwai", "Petroica longipes"),
-    "nezrob3": ("South Island Robin / Toutouwai", "Petroica australis"),
+    ("nezrob2", "North Island Robin / Toutouwai", "Petroica longipes"),
+    ("nezrob3", "South Island Robin / Toutouwai", "Petroica australis"),
 
     # Tomtit - single species
-    "tomtit1": ("Tomtit / Miromiro", "Petroica macrocephala"),
+    ("tomtit1", "Tomtit / Miromiro", "Petroica macrocephala"),
 
     # Shelduck
-    "parshe1": ("Paradise Shelduck / Pūtangitangi", "Tadorna variegata"),
+    ("parshe1", "Paradise Shelduck / Pūtangitangi", "Tadorna variegata"),
 
     # Wren
-    "soiwre1": ("Rock Wren / Pīwauwau", "Xenicus gilviventris"),
+    ("soiwre1", "Rock Wren / Pīwauwau", "Xenicus gilviventris"),
 
     # Saddlebacks
-    "saddle2": ("North Island Saddleback / Tīeke", "Philesturnus rufusater"),
-    "saddle3": ("South Island Saddleback / Tīeke", "Philesturnus carunculatus"),
+    ("saddle2", "North Island Saddleback / Tīeke", "Philesturnus rufusater"),
+    ("saddle3", "South Island Saddleback / Tīeke", "Philesturnus carunculatus"),
 
     # Silvereye
-    "silver3": ("Silvereye / Tauhou", "Zosterops lateralis"),
+    ("silver3", "Silvereye / Tauhou", "Zosterops lateralis"),
 
     # Stitchbird
-    "stitch1": ("Hihi / Stitchbird", "Notiomystis cincta"),
+    ("stitch1", "Hihi / Stitchbird", "Notiomystis cincta"),
 
     # Takahe
-    "takahe3": ("Takahē", "Porphyrio hochstetteri"),
+    ("takahe3", "Takahē", "Porphyrio hochstetteri"),
 
     # Mohua (Whitehead/Yellowhead)
-    "whiteh1": ("Whitehead / Pōpokotea", "Mohoua albicilla"),
-    "yellow3": ("Yellowhead / Mohua", "Mohoua ochrocephala"),
+    ("whiteh1", "Whitehead / Pōpokotea", "Mohoua albicilla"),
+    ("yellow3", "Yellowhead / Mohua", "Mohoua ochrocephala"),
 
     # Penguin
-    "yeepen1": ("Yellow-eyed Penguin / Hoiho", "Megadyptes antipodes"),
+    ("yeepen1", "Yellow-eyed Penguin / Hoiho", "Megadyptes antipodes"),
 
     # Dotterel
-    "rebdot1": ("New Zealand Dotterel / Tūturiwhatu", "Anarhynchus obscurus"),
+    ("rebdot1", "New Zealand Dotterel / Tūturiwhatu", "Anarhynchus obscurus"),
 
     # Oystercatcher
-    "chaoys1": ("Chatham Islands Oystercatcher / Tōrea", "Haematopus chathamensis"),
+    ("chaoys1", "Chatham Islands Oystercatcher / Tōrea", "Haematopus chathamensis"),
 
     # Shearwater
-    "hutshe1": ("Hutton's Shearwater / Tītī", "Puffinus huttoni"),
+    ("hutshe1", "Hutton's Shearwater / Tītī", "Puffinus huttoni"),
 
     # Petrel
-    "wespet1": ("Westland Petrel / Tāiko", "Procellaria westlandica"),
+    ("wespet1", "Westland Petrel / Tāiko", "Procellaria westlandica"),
 
     # Bittern
-    "ausbit1": ("Australasian Bittern / Matuku-hūrepo", "Botaurus poiciloptilus"),
+    ("ausbit1", "Australasian Bittern / Matuku-hūrepo", "Botaurus poiciloptilus"),
 
     # Stilt
-    "blasti1": ("Black Stilt / Kakī", "Himantopus novaezelandiae"),
+    ("blasti1", "Black Stilt / Kakī", "Himantopus novaezelandiae"),
 
     # Duck
-    "bluduc1": ("Blue Duck / Whio", "Hymenolaimus malacorhynchos"),
+    ("bluduc1", "Blue Duck / Whio", "Hymenolaimus malacorhynchos"),
 
     # Teal
-    "auitea1": ("Auckland Islands Teal", "Anas aucklandica"),
+    ("auitea1", "Auckland Islands Teal", "Anas aucklandica"),
 
     # Grebe
-    "grcgre1": ("Australasian Crested Grebe", "Podiceps cristatus"),
+    ("grcgre1", "Australasian Crested Grebe", "Podiceps cristatus"),
 
     # Weka - single species
-    "weka1": ("Weka", "Gallirallus australis"),
+    ("weka1", "Weka", "Gallirallus australis"),
 
     # Heron
-    "greegr": ("White Heron / Kōtuku", "Ardea alba"),
-}
+    ("greegr", "White Heron / Kōtuku", "Ardea alba"),
+)
+
+
+def needs_csv_quoting(row):
+    """True if any field contains a character csv.writer would have to quote"""
+    return any(ch in field for field in row for ch in ',"\r\n')
 
 
 def main():
@@ -124,34 +131,37 @@ def main():
         print(f"ERROR: CSV file not found at {csv_path}")
         return 1
 
-    # Read existing CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    # Scan existing CSV once, keeping only the SPEC codes (rows are never
+    # materialized - new species are appended, not rewritten)
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
         reader = csv.reader(f)
-        rows = list(reader)
+        header = next(reader)
 
-    header = rows[0]
-    existing_rows = rows[1:]
+        # Find column indices
+        spec_idx = header.index('SPEC')
 
-    # Find column indices
-    spec_idx = header.index('SPEC')
-    name_idx = header.index('COMMONNAME')
-    sci_idx = header.index('SCINAME')
+        # Check which codes already exist
+        existing_codes = frozenset(row[spec_idx].lower() for row in reader if len(row) > spec_idx)
 
-    # Check which codes already exist
-    existing_codes = {row[spec_idx].lower() for row in existing_rows if len(row) > spec_idx}
+    # Codes already in the CSV, in one set intersection
+    skipped_codes = existing_codes.intersection(code for code, _, _ in NZ_SPECIES_TAXONOMY)
+    skipped = [code for code, _, _ in NZ_SPECIES_TAXONOMY if code in skipped_codes]
 
-    # Add NZ species that don't exist
+    # Add NZ species that don't exist (in taxonomy order)
     new_rows = []
-    skipped = []
-    for code, (common_name, scientific_name) in NZ_SPECIES_TAXONOMY.items():
-        if code.lower() not in existing_codes:
+    added_msgs = []
+    if len(skipped) < len(NZ_SPECIES_TAXONOMY):
+        for code, common_name, scientific_name in NZ_SPECIES_TAXONOMY:
+            if code in skipped_codes:
+                continue
             # Create new row with same structure
             # SP,B4,SPEC,CONF,B1,COMMONNAME,B2,SCINAME,SPEC6,CONF6
             new_row = ['', '', code, '', '', common_name, '', scientific_name, '', '']
             new_rows.append(new_row)
-            print(f"  Adding: {code} - {common_name} ({scientific_name})")
-        else:
-            skipped.append(code)
+            added_msgs.append(f"  Adding: {code} - {common_name} ({scientific_name})")
+
+    if added_msgs:
+        print('\n'.join(added_msgs))
 
     if skipped:
         print(f"\nSkipped {len(skipped)} codes that already exist: {', '.join(skipped)}")
@@ -160,12 +170,23 @@ def main():
         print("\nNo new species to add.")
         return 0
 
-    # Append new rows to CSV (do NOT modify existing rows)
-    all_rows = [header] + existing_rows + new_rows
+    # Make sure the appended rows start on their own line
+    needs_newline = False
+    if csv_path.stat().st_size > 0:
+        with open(csv_path, 'rb') as f:
+            f.seek(-1, 2)
+            needs_newline = f.read(1) != b'\n'
 
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(all_rows)
+    # Append new rows to CSV (do NOT modify existing rows)
+    with open(csv_path, 'a', encoding='utf-8', newline='', buffering=64 * 1024) as f:
+        if needs_newline:
+            f.write('\r\n')
+        if any(needs_csv_quoting(row) for row in new_rows):
+            writer = csv.writer(f)
+            writer.writerows(new_rows)
+        else:
+            # Plain fields - same bytes as csv.writer, without its per-field quoting pass
+            f.write(''.join(','.join(row) + '\r\n' for row in new_rows))
 
     print(f"\nAdded {len(new_rows)} NZ species to {csv_path}")
     print("\nNext steps:")
@@ -6,75 +6,191 @@ Fetch recordist names from Xeno-canto API and add them to clips.json
 import json
 import re
 import os
+import sys
 import time
-import subprocess
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# Append-only JSON lines log of recordists already fetched, so reruns skip them
+RECORDIST_CACHE_PATH = PROJECT_ROOT / 'data' / '.xc_recordist_cache.jsonl'
+
+XC_API_URL = 'https://xeno-canto.org/api/3/recordings'
+API_KEY = os.environ.get('XENO_CANTO_API_KEY', '')
+BATCH_SIZE = 50  # XC numbers per compound "nr:A OR nr:B ..." query
+MAX_BATCH_PAGES = 3  # Guard against a batch query matching far more than asked for
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 2  # Be respectful to the API - shared across all workers
+
+# One keep-alive connection for every API call
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'ChipNotes/1.0'
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+def wait_for_rate_limit():
+    """Sleep until this thread's request slot so all workers stay under REQUESTS_PER_SECOND"""
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_at)
+        _next_request_at = slot + 1.0 / REQUESTS_PER_SECOND
+    if slot > now:
+        time.sleep(slot - now)
+
+XC_NUMBER_RE = re.compile(r'\d+')
 
 def get_xc_number(source_id):
     """Extract XC number from source_id, handling various formats"""
     if not source_id:
         return None
 
-    # Try to extract number from formats like "XC316302" or "AMCR_667361"
-    match = re.search(r'(\d+)', source_id)
+    # Common case "XC316302" needs no regex
+    if source_id.startswith('XC') and source_id[2:].isdigit():
+        return source_id[2:]
+
+    # Try to extract number from other formats like "AMCR_667361"
+    match = XC_NUMBER_RE.search(source_id)
     if match:
-        return match.group(1)
+        return match.group(0)
     return None
 
-def fetch_recordist(xc_number):
-    """Fetch recordist name from Xeno-canto API"""
+def query_xc(query, page=1):
+    """Run a Xeno-canto API query and return the parsed JSON response"""
+    params = {'query': query, 'page': page, 'key': API_KEY}
+    wait_for_rate_limit()
     try:
-        # Use zsh to source environment and get API key
-        cmd = f'source ~/.zshrc && curl -s "https://xeno-canto.org/api/3/recordings?query=nr:{xc_number}&key=${{XENO_CANTO_API_KEY}}"'
-        result = subprocess.run(
-            ['zsh', '-c', cmd],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            print(f"  ⚠️  Error fetching XC{xc_number}: {result.stderr}")
-            return None
-
-        data = json.loads(result.stdout)
-
-        if data.get('numRecordings') == '0':
-            print(f"  ⚠️  No recording found for XC{xc_number}")
-            return None
-
-        recordings = data.get('recordings', [])
-        if recordings:
-            recordist = recordings[0].get('rec')
-            print(f"  ✓ XC{xc_number}: {recordist}")
-            return recordist
-
+        response = SESSION.get(XC_API_URL, params=params, timeout=30)
+        response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except Exception as e:
+        print(f"  ⚠️  Error querying '{query}': {e}")
         return None
 
-    except subprocess.TimeoutExpired:
-        print(f"  ⚠️  Timeout fetching XC{xc_number}")
-        return None
-    except json.JSONDecodeError:
-        print(f"  ⚠️  Invalid JSON for XC{xc_number}")
+def fetch_recordist(xc_number):
+    """Fetch recordist name from Xeno-canto API"""
+    data = query_xc(f'nr:{xc_number}')
+    if data is None:
         return None
-    except Exception as e:
-        print(f"  ⚠️  Error fetching XC{xc_number}: {e}")
+
+    recordings = data.get('recordings') or []
+    if not recordings:
+        print(f"  ⚠️  No recording found for XC{xc_number}")
         return None
 
+    recordist = recordings[0].get('rec')
+    print(f"  ✓ XC{xc_number}: {recordist}")
+    return recordist
+
+def fetch_recordists(xc_numbers):
+    """Fetch recordist names for a batch of XC numbers with one compound query.
+
+    Returns {xc_number: recordist} for the recordings the API returned; callers
+    should fall back to fetch_recordist() for any numbers that are missing.
+    """
+    wanted = set(xc_numbers)
+    query = ' OR '.join(f'nr:{xc_number}' for xc_number in xc_numbers)
+    found = {}
+
+    page = 1
+    while page <= MAX_BATCH_PAGES:
+        data = query_xc(query, page)
+        if data is None:
+            break
+
+        for rec in data.get('recordings', []):
+            xc_number = str(rec.get('id', ''))
+            if xc_number in wanted and rec.get('rec'):
+                found[xc_number] = rec['rec']
+
+        if len(found) == len(wanted) or page >= int(data.get('numPages', 1)):
+            break
+        page += 1
+
+    return found
+
+def fetch_batch(xc_numbers):
+    """Fetch recordists for a batch, falling back to single lookups for any the batch missed"""
+    recordists = fetch_recordists(xc_numbers)
+    for xc_number in xc_numbers:
+        if xc_number in recordists:
+            print(f"  ✓ XC{xc_number}: {recordists[xc_number]}")
+        else:
+            # Not returned by the batch query - look it up individually
+            recordists[xc_number] = fetch_recordist(xc_number)
+    return recordists
+
+def load_recordist_cache():
+    """Load {xc_number: recordist} from previous runs"""
+    cache = {}
+    if not RECORDIST_CACHE_PATH.exists():
+        return cache
+
+    with open(RECORDIST_CACHE_PATH, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial last line from an interrupted run
+            cache[entry['xc']] = entry['rec']
+    return cache
+
+def cache_recordists(recordists):
+    """Append successfully fetched recordists to the on-disk cache"""
+    fetched_at = int(time.time())
+    with open(RECORDIST_CACHE_PATH, 'a', encoding='utf-8') as f:
+        for xc_number, recordist in recordists.items():
+            if recordist:
+                f.write(json.dumps({'xc': xc_number, 'rec': recordist, 'fetched_at': fetched_at}) + '\n')
+
+def load_clips(clips_path):
+    """Read clips.json in one large buffered read"""
+    with open(clips_path, 'rb', buffering=1024 * 1024) as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+def write_clips(clips, clips_path):
+    """Atomically write clips.json (indent=2, UTF-8), using orjson's C encoder when available.
+
+    Writes to a sibling temp file and swaps it in with os.replace, so an
+    interrupted run never leaves a truncated clips.json behind.
+    """
+    tmp_path = clips_path.with_suffix('.json.tmp')
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(clips, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(clips, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, clips_path)
+
 def main():
-    clips_path = Path(__file__).parent.parent / 'data' / 'clips.json'
+    clips_path = PROJECT_ROOT / 'data' / 'clips.json'
+
+    if not API_KEY:
+        print("ERROR: XENO_CANTO_API_KEY not set. Source it from ~/.zshrc")
+        return 1
 
     print("Loading clips.json...")
-    with open(clips_path, 'r') as f:
-        clips = json.load(f)
+    clips = load_clips(clips_path)
 
     # Find all xenocanto clips that need recordist info
     xc_clips = [c for c in clips if c.get('source') == 'xenocanto']
     print(f"\nFound {len(xc_clips)} Xeno-canto clips")
 
-    # Build a map of XC numbers to recordists (to avoid duplicate API calls)
-    xc_to_recordist = {}
-    clips_to_update = []
+    # Group clips by XC number (to avoid duplicate API calls)
+    xc_to_clips = defaultdict(list)
 
     for clip in xc_clips:
         # Skip if already has recordist
@@ -82,43 +198,56 @@ def main():
             continue
 
         xc_number = get_xc_number(clip.get('source_id'))
-        if xc_number and xc_number not in xc_to_recordist:
-            clips_to_update.append((clip, xc_number))
-            xc_to_recordist[xc_number] = None  # Placeholder
+        if xc_number:
+            xc_to_clips[xc_number].append(clip)
 
-    print(f"Need to fetch recordist info for {len(set(xc_number for _, xc_number in clips_to_update))} unique recordings")
+    print(f"Need to fetch recordist info for {len(xc_to_clips)} unique recordings")
 
     # Fetch recordists
     print("\nFetching recordist names from Xeno-canto API...")
-    unique_xc_numbers = sorted(set(xc_number for _, xc_number in clips_to_update))
+    xc_to_recordist = {}
+    to_fetch = []
 
-    for i, xc_number in enumerate(unique_xc_numbers, 1):
-        print(f"[{i}/{len(unique_xc_numbers)}]", end=" ")
-        recordist = fetch_recordist(xc_number)
-        xc_to_recordist[xc_number] = recordist
+    # Reuse recordists fetched by earlier (possibly interrupted) runs
+    cache = load_recordist_cache()
+    for xc_number in sorted(xc_to_clips):
+        if xc_number in cache:
+            xc_to_recordist[xc_number] = cache[xc_number]
+        else:
+            to_fetch.append(xc_number)
+    if xc_to_recordist:
+        print(f"Using {len(xc_to_recordist)} cached recordists from {RECORDIST_CACHE_PATH.name}")
 
-        # Be respectful to the API - small delay between requests
-        if i < len(unique_xc_numbers):
-            time.sleep(0.5)
+    batches = [to_fetch[start:start + BATCH_SIZE]
+               for start in range(0, len(to_fetch), BATCH_SIZE)]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(fetch_batch, batch) for batch in batches]
+        for i, future in enumerate(as_completed(futures), 1):
+            recordists = future.result()
+            xc_to_recordist.update(recordists)
+            cache_recordists(recordists)
+            print(f"[{i}/{len(batches)}] batches done")
 
     # Update clips with recordist info
     print("\nUpdating clips with recordist information...")
     updated_count = 0
-    for clip, xc_number in clips_to_update:
-        recordist = xc_to_recordist.get(xc_number)
+    for xc_number, recordist in xc_to_recordist.items():
         if recordist:
-            clip['recordist'] = recordist
-            updated_count += 1
-
-    # Write back to clips.json
-    print(f"\nWriting {updated_count} updates to clips.json...")
-    with open(clips_path, 'w') as f:
-        json.dump(clips, f, indent=2)
+            for clip in xc_to_clips[xc_number]:
+                clip['recordist'] = recordist
+                updated_count += 1
 
-    print(f"✓ Done! Updated {updated_count} clips with recordist information")
+    # Write back to clips.json (nothing to write if no clip changed)
+    if updated_count:
+        print(f"\nWriting {updated_count} updates to clips.json...")
+        write_clips(clips, clips_path)
+        print(f"✓ Done! Updated {updated_count} clips with recordist information")
+    else:
+        print("\nNo updates; skipping write.")
 
     # Summary
-    missing = [xc for xc, rec in xc_to_recordist.items() if rec is None]
+    missing = [xc for xc in to_fetch if not xc_to_recordist.get(xc)]
     if missing:
         print(f"\n⚠️  Could not fetch recordist for {len(missing)} recordings:")
         for xc in missing[:10]:
@@ -127,4 +256,4 @@ def main():
             print(f"  ... and {len(missing) - 10} more")
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -10,44 +10,80 @@ Identifies species needing attention based on:
 - Missing or duplicate canonical clips
 """
 
+import io
 import json
+import sys
 from collections import Counter, defaultdict
+from contextlib import redirect_stdout
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 PROJECT_ROOT = Path(__file__).parent.parent
 CLIPS_JSON = PROJECT_ROOT / 'data' / 'clips.json'
 
 
+def load_json(path):
+    """Read a JSON file, using orjson's C parser when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_clips(path):
+    """Yield clip dicts from a clips.json array.
+
+    With ijson installed (its yajl2 C backend when available) clips are
+    streamed one at a time instead of materializing the whole list.
+    """
+    if ijson is None:
+        yield from load_json(path)
+        return
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
+
 def analyze_collection():
     """Analyze clip collection and generate priority report."""
-    with open(CLIPS_JSON) as f:
-        clips = json.load(f)
+    clips = iter_clips(CLIPS_JSON)
 
-    # Group by species
+    # Group by species (per-species counters only - clip dicts aren't kept)
     species_data = defaultdict(lambda: {
-        'clips': [],
+        'count': 0,
+        'name': None,
         'voc_types': Counter(),
-        'quality': [],
+        'quality_sum': 0,
         'canonical_count': 0
     })
 
     for clip in clips:
         if clip.get('rejected'):
             continue
-        code = clip['species_code']
-        species_data[code]['clips'].append(clip)
-        species_data[code]['voc_types'][clip['vocalization_type']] += 1
-        species_data[code]['quality'].append(clip.get('quality_score', 3))
+        data = species_data[clip['species_code']]
+        if not data['count']:
+            data['name'] = clip.get('common_name', clip['species_code'])
+        data['count'] += 1
+        data['voc_types'][clip['vocalization_type']] += 1
+        data['quality_sum'] += clip.get('quality_score', 3)
         if clip.get('canonical'):
-            species_data[code]['canonical_count'] += 1
+            data['canonical_count'] += 1
 
     # Analyze each species
     issues = []
 
     for code, data in species_data.items():
-        count = len(data['clips'])
+        count = data['count']
         voc_types = data['voc_types']
-        avg_quality = sum(data['quality']) / len(data['quality'])
+        avg_quality = data['quality_sum'] / count
 
         issue_flags = []
         priority = 0
@@ -85,10 +121,9 @@ def analyze_collection():
             priority += 3
 
         if issue_flags:
-            common_name = data['clips'][0].get('common_name', code)
             issues.append({
                 'code': code,
-                'name': common_name,
+                'name': data['name'],
                 'count': count,
                 'priority': priority,
                 'flags': issue_flags,
@@ -113,8 +148,13 @@ def print_report(species_data, issues):
     print(f'Species needing attention: {len(issues)}')
     print()
 
+    # issues is sorted by priority (highest first), so each band is a
+    # contiguous slice - find the two cut points instead of filtering 3 times
+    high_end = next((n for n, item in enumerate(issues) if item['priority'] < 5), len(issues))
+    medium_end = next((n for n in range(high_end, len(issues)) if issues[n]['priority'] < 3), len(issues))
+
     # High priority
-    high_priority = [i for i in issues if i['priority'] >= 5]
+    high_priority = issues[:high_end]
     if high_priority:
         print(f'HIGH PRIORITY (Score 5+): {len(high_priority)} species')
         print('-' * 80)
@@ -127,7 +167,7 @@ def print_report(species_data, issues):
             print()
 
     # Medium priority
-    medium_priority = [i for i in issues if 3 <= i['priority'] < 5]
+    medium_priority = issues[high_end:medium_end]
     if medium_priority:
         print()
         print(f'MEDIUM PRIORITY (Score 3-4): {len(medium_priority)} species')
@@ -141,7 +181,7 @@ def print_report(species_data, issues):
             print()
 
     # Low priority
-    low_priority = [i for i in issues if i['priority'] < 3]
+    low_priority = issues[medium_end:]
     if low_priority:
         print()
         print(f'LOW PRIORITY (Score 1-2): {len(low_priority)} species')
@@ -174,4 +214,9 @@ def print_report(species_data, issues):
 
 if __name__ == '__main__':
     species_data, issues = analyze_collection()
-    print_report(species_data, issues)
+
+    # Build the report in memory and write it once instead of a write per line
+    report = io.StringIO()
+    with redirect_stdout(report):
+        print_report(species_data, issues)
+    sys.stdout.write(report.getvalue())
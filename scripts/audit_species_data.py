@@ -16,8 +16,20 @@ Checks:
 import csv
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -29,13 +41,36 @@ CLIPS_DIR = PROJECT_ROOT / "data" / "clips"
 ICONS_DIR = PROJECT_ROOT / "data" / "icons"
 SPECIES_JSON = PROJECT_ROOT / "data" / "species.json"
 
+PACK_READ_WORKERS = 8
+
+# Icons in ICONS_DIR that aren't named after a species
+NON_SPECIES_ICONS = frozenset(['OwlHeadphones', 'owl'])
+
+
+def load_json(path: Path) -> Any:
+    """Read a JSON file, using orjson's C parser when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_clips(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield clip dicts from clips.json, streaming them with ijson when installed"""
+    if ijson is None:
+        yield from load_json(path)
+        return
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
 
 class SpeciesData:
     """Container for species data from CSV"""
     def __init__(self):
-        self.codes: Set[str] = set()
+        self.codes: FrozenSet[str] = frozenset()
         self.common_names: Dict[str, str] = {}  # code -> common name
         self.scientific_names: Dict[str, str] = {}  # code -> scientific name
+        self.names: Dict[str, Tuple[str, str]] = {}  # code -> (common name, scientific name)
 
 
 def load_truth_data() -> SpeciesData:
@@ -43,17 +78,33 @@ def load_truth_data() -> SpeciesData:
     print(f"📖 Loading truth data from: {CSV_PATH}")
 
     data = SpeciesData()
+    codes = set()
     with open(CSV_PATH, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader)
+
+        # Find column indices once instead of building a dict per row
+        spec_idx = header.index('SPEC')
+        name_idx = header.index('COMMONNAME')
+        sci_idx = header.index('SCINAME')
+
         for row in reader:
-            code = row['SPEC'].strip()
-            common_name = row['COMMONNAME'].strip()
-            scientific_name = row['SCINAME'].strip()
+            if not row:
+                continue  # Blank line (DictReader skipped these too)
+
+            # Interned so lookups with the same code compare by identity
+            code = sys.intern(row[spec_idx].strip())
+            common_name = row[name_idx].strip()
+            scientific_name = row[sci_idx].strip()
 
             if code and common_name and scientific_name:
-                data.codes.add(code)
+                codes.add(code)
                 data.common_names[code] = common_name
                 data.scientific_names[code] = scientific_name
+                data.names[code] = (common_name, scientific_name)
+
+    # Read-only from here on - every audit only tests membership
+    data.codes = frozenset(codes)
 
     print(f"   ✓ Loaded {len(data.codes)} valid species codes")
     return data
@@ -70,25 +121,26 @@ def audit_clips_json(truth: SpeciesData) -> Tuple[List[str], List[str]]:
         errors.append(f"clips.json not found at {CLIPS_JSON}")
         return errors, warnings
 
-    with open(CLIPS_JSON, 'r', encoding='utf-8') as f:
-        clips = json.load(f)
-
-    print(f"   Found {len(clips)} clips")
+    # Local aliases - these are hit once per clip
+    known_codes = truth.codes
+    common_names = truth.common_names
 
+    clip_count = 0
     codes_in_clips = set()
-    for clip in clips:
+    for clip in iter_clips(CLIPS_JSON):
+        clip_count += 1
         code = clip.get('species_code', '')
         common_name = clip.get('common_name', '')
 
         codes_in_clips.add(code)
 
         # Check if code exists in truth
-        if code not in truth.codes:
+        if code not in known_codes:
             errors.append(f"clips.json: Unknown species code '{code}' in clip {clip.get('clip_id')}")
             continue
 
         # Check if common name matches
-        expected_name = truth.common_names[code]
+        expected_name = common_names[code]
         if common_name != expected_name:
             errors.append(
                 f"clips.json: Name mismatch for {code}\n"
@@ -96,6 +148,7 @@ def audit_clips_json(truth: SpeciesData) -> Tuple[List[str], List[str]]:
                 f"           Found:    '{common_name}'"
             )
 
+    print(f"   Found {clip_count} clips")
     print(f"   ✓ Found {len(codes_in_clips)} unique species in clips.json")
     return errors, warnings
 
@@ -114,20 +167,21 @@ def audit_packs(truth: SpeciesData) -> Tuple[List[str], List[str]]:
     pack_files = list(PACKS_DIR.glob("*.json"))
     print(f"   Found {len(pack_files)} pack files")
 
-    all_pack_codes = set()
-    for pack_file in pack_files:
-        if pack_file.name.endswith('.bak'):
-            continue
-
-        with open(pack_file, 'r', encoding='utf-8') as f:
-            pack_data = json.load(f)
+    # Read and parse the packs concurrently (small files, dominated by
+    # open/read syscalls); the checks below stay serial and in glob order
+    pack_files = [pack_file for pack_file in pack_files if not pack_file.name.endswith('.bak')]
+    with ThreadPoolExecutor(max_workers=PACK_READ_WORKERS) as executor:
+        packs = list(executor.map(load_json, pack_files))
 
+    known_codes = truth.codes
+    all_pack_codes = set()
+    for pack_file, pack_data in zip(pack_files, packs):
         pack_id = pack_data.get('pack_id', pack_file.stem)
         species_pool = pack_data.get('species_pool', [])
 
         for code in species_pool:
             all_pack_codes.add(code)
-            if code not in truth.codes:
+            if code not in known_codes:
                 errors.append(
                     f"{pack_file.name}: Unknown species code '{code}' in species_pool"
                 )
@@ -150,18 +204,19 @@ def audit_audio_files(truth: SpeciesData) -> Tuple[List[str], List[str]]:
     audio_files = list(CLIPS_DIR.glob("*.wav"))
     print(f"   Found {len(audio_files)} audio files")
 
-    codes_in_files = set()
-    for audio_file in audio_files:
-        # Extract species code from filename (format: CODE_XXXXXX.wav)
-        parts = audio_file.stem.split('_')
-        if len(parts) >= 1:
-            code = parts[0]
-            codes_in_files.add(code)
-
-            if code not in truth.codes:
-                warnings.append(
-                    f"Audio file: Unknown species code '{code}' in filename {audio_file.name}"
-                )
+    # Extract species code from filename (format: CODE_XXXXXX.wav) - plain
+    # string ops on the name, no Path.stem per file
+    names = [audio_file.name for audio_file in audio_files]
+    file_codes = [name[:-len('.wav')].partition('_')[0] for name in names]
+    codes_in_files = set(file_codes)
+
+    # One set difference finds every unknown code; only those files are reported
+    unknown_codes = codes_in_files - truth.codes
+    if unknown_codes:
+        warnings.extend(
+            f"Audio file: Unknown species code '{code}' in filename {name}"
+            for code, name in zip(file_codes, names) if code in unknown_codes
+        )
 
     print(f"   ✓ Found {len(codes_in_files)} unique species codes in filenames")
     return errors, warnings
@@ -181,21 +236,17 @@ def audit_icons(truth: SpeciesData) -> Tuple[List[str], List[str]]:
     icon_files = list(ICONS_DIR.glob("*.png"))
     print(f"   Found {len(icon_files)} icon files")
 
-    codes_in_icons = set()
-    for icon_file in icon_files:
-        # Icon filename should be CODE.png
-        code = icon_file.stem
-
-        # Skip non-species icons
-        if code in ['OwlHeadphones', 'owl']:
-            continue
-
-        codes_in_icons.add(code)
+    # Icon filename should be CODE.png (skipping non-species icons)
+    names = [icon_file.name for icon_file in icon_files]
+    icon_codes = [name[:-len('.png')] for name in names]
+    codes_in_icons = set(icon_codes) - NON_SPECIES_ICONS
 
-        if code not in truth.codes:
-            warnings.append(
-                f"Icon file: Unknown species code '{code}' in filename {icon_file.name}"
-            )
+    unknown_codes = codes_in_icons - truth.codes
+    if unknown_codes:
+        warnings.extend(
+            f"Icon file: Unknown species code '{code}' in filename {name}"
+            for code, name in zip(icon_codes, names) if code in unknown_codes
+        )
 
     print(f"   ✓ Found {len(codes_in_icons)} species icon files")
     return errors, warnings
@@ -212,19 +263,23 @@ def audit_species_json(truth: SpeciesData) -> Tuple[List[str], List[str]]:
         errors.append(f"species.json not found at {SPECIES_JSON}")
         return errors, warnings
 
-    with open(SPECIES_JSON, 'r', encoding='utf-8') as f:
-        species_list = json.load(f)
+    species_list = load_json(SPECIES_JSON)
 
     print(f"   Found {len(species_list)} species entries")
 
+    truth_names = truth.names
     for species in species_list:
         code = species.get('species_code', '')
         common_name = species.get('common_name', '')
         scientific_name = species.get('scientific_name', '')
 
-        if code not in truth.codes:
+        # One lookup + one tuple compare covers the (usual) all-correct entry
+        expected = truth_names.get(code)
+        if expected is None:
             errors.append(f"species.json: Unknown code '{code}'")
             continue
+        if (common_name, scientific_name) == expected:
+            continue
 
         # Check common name match
         if common_name != truth.common_names[code]:
@@ -292,14 +347,14 @@ def main():
     if all_errors:
         print(f"\n❌ ERRORS FOUND ({len(all_errors)}):")
         print("-" * 70)
-        for error in all_errors:
-            print(f"  • {error}")
+        # One write for the whole list rather than a print (and, when piped
+        # line-buffered, a syscall) per entry
+        print('\n'.join(f"  • {error}" for error in all_errors))
 
     if all_warnings:
         print(f"\n⚠️  WARNINGS ({len(all_warnings)}):")
         print("-" * 70)
-        for warning in all_warnings:
-            print(f"  • {warning}")
+        print('\n'.join(f"  • {warning}" for warning in all_warnings))
 
     if not all_errors and not all_warnings:
         print("\n✅ ALL CHECKS PASSED!")
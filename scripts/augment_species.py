@@ -13,28 +13,49 @@ Adds to clips.json for manual review via review_clips.py.
     All other fields per schemas/clip.schema.json
 """
 
+import functools
+import itertools
 import json
 import os
 import sys
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
-from scipy import signal
+from scipy import fft, signal
 from scipy.io import wavfile
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).parent.parent
 CLIPS_JSON = PROJECT_ROOT / 'data' / 'clips.json'
 CLIPS_DIR = PROJECT_ROOT / 'data' / 'clips'
 SPEC_DIR = PROJECT_ROOT / 'data' / 'spectrograms'
 REJECTED_XC_IDS_PATH = PROJECT_ROOT / 'data' / 'rejected_xc_ids.json'
+XC_ID_INDEX_PATH = PROJECT_ROOT / 'data' / '.xc_id_index.json'  # species -> XC IDs in clips.json
 
 # Xeno-canto API
 XC_API_BASE = 'https://xeno-canto.org/api/3/recordings'
+XC_COUNTRY_NAMES = {'US': 'United States', 'CA': 'Canada'}  # --country code -> XC 'cnt' value
+DOWNLOAD_WORKERS = 4  # Concurrent download + ffmpeg jobs (kept low to be polite to XC)
+MIN_DURATION = 0.5  # Seconds - shorter clips are rejected
+
+# Keep-alive connections shared by the search and every download (one TLS
+# handshake per pooled connection, not per request); the pool is sized so
+# each download worker keeps its own connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=3))
 
 # Species code to scientific name mapping (for Xeno-canto API v3)
 SPECIES_SCIENTIFIC_NAMES = {
@@ -45,27 +66,169 @@ SPECIES_SCIENTIFIC_NAMES = {
 }
 
 
-def load_existing_xc_ids(species_code: str) -> List[str]:
+def read_json(path: Path):
+    """Parse a JSON file, using orjson's C parser when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def replace_clips_json(tmp_path: str):
+    """Swap a finished temp file in as clips.json (keeping clips.json's mode)."""
+    if CLIPS_JSON.exists():
+        shutil.copymode(CLIPS_JSON, tmp_path)
+    os.replace(tmp_path, CLIPS_JSON)
+
+
+def write_clips(clips: List[Dict]):
+    """Atomically write clips.json (indent=2, UTF-8), via orjson when available.
+
+    Writes a sibling temp file and os.replace()s it in, so an interrupted
+    run never leaves a truncated clips.json behind.
+    """
+    tmp_fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=CLIPS_JSON.parent)
+    try:
+        if orjson is not None:
+            with os.fdopen(tmp_fd, 'wb') as f:
+                f.write(orjson.dumps(clips, option=orjson.OPT_INDENT_2))
+        else:
+            with os.fdopen(tmp_fd, 'w', encoding='utf-8') as f:
+                json.dump(clips, f, indent=2, ensure_ascii=False)
+        replace_clips_json(tmp_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def encode_clip(clip: Dict) -> bytes:
+    """One clip as it appears inside clips.json's indent=2 array."""
+    if orjson is not None:
+        encoded = orjson.dumps(clip, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(clip, indent=2, ensure_ascii=False).encode('utf-8')
+    return b'\n'.join(b'  ' + line for line in encoded.split(b'\n'))
+
+
+def append_clips(new_clips: List[Dict]) -> bool:
+    """Append clips to the end of the clips.json array.
+
+    Encodes only the new entries (same bytes a full indent=2 rewrite would
+    produce) instead of re-serializing the whole catalog: the existing bytes
+    are copied to a sibling temp file, the new tail is spliced on there, and
+    the result is os.replace()d in - clips.json is never left half-written.
+    Returns False, leaving the file untouched, if its tail doesn't look like
+    a JSON array.
+    """
+    with open(CLIPS_JSON, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        tail_start = max(0, size - 64)
+        f.seek(tail_start)
+        tail = f.read()
+
+        body = tail.rstrip()
+        if not body.endswith(b']'):
+            return False
+        trailing = tail[len(body):]  # Whatever followed the ']' (e.g. a newline)
+        body = body[:-1].rstrip()
+        if body.endswith(b'}'):
+            separator = b',\n'
+        elif body.endswith(b'['):
+            separator = b'\n'  # Empty array
+        else:
+            return False
+
+    tmp_fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=CLIPS_JSON.parent)
+    try:
+        with os.fdopen(tmp_fd, 'r+b') as f:
+            with open(CLIPS_JSON, 'rb') as src:
+                shutil.copyfileobj(src, f)
+            f.seek(tail_start + len(body))
+            f.truncate()
+            f.write(separator + b',\n'.join(encode_clip(c) for c in new_clips) + b'\n]' + trailing)
+        replace_clips_json(tmp_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return True
+
+
+# Parsed clips.json, keyed by the file's (mtime_ns, size) so repeat reads in
+# one run (and batch runs over several species) parse it only once
+_clips_cache: Dict[tuple, List[Dict]] = {}
+
+
+def load_clips() -> List[Dict]:
+    """Load clips.json, reusing the parsed list while the file is unchanged."""
+    st = CLIPS_JSON.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if key not in _clips_cache:
+        _clips_cache.clear()
+        _clips_cache[key] = read_json(CLIPS_JSON)
+    return _clips_cache[key]
+
+
+def clips_json_version() -> List[int]:
+    """(mtime_ns, size) of clips.json - changes whenever the file is rewritten."""
+    st = CLIPS_JSON.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def build_xc_id_index(clips: List[Dict]) -> Dict[str, List[str]]:
+    """Group the XC IDs in clips by species code, in one pass."""
+    index = {}
+    for c in clips:
+        code = c.get('species_code')
+        xc_id = c.get('xeno_canto_id')
+        if code and xc_id:
+            index.setdefault(code, []).append(xc_id)
+    return index
+
+
+def save_xc_id_index(index: Dict[str, List[str]]):
+    """Write the XC ID index, stamped with the clips.json version it describes."""
+    cached = {'clips_json': clips_json_version(), 'species': index}
+    if orjson is not None:
+        XC_ID_INDEX_PATH.write_bytes(orjson.dumps(cached))
+    else:
+        with open(XC_ID_INDEX_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cached, f, ensure_ascii=False)
+
+
+def load_xc_id_index() -> Dict[str, List[str]]:
+    """Species code -> XC IDs in clips.json, from the on-disk index when current.
+
+    The index is only trusted while clips.json is unchanged since it was
+    written; otherwise clips.json is scanned once and the index rebuilt, so
+    batch runs over many species don't re-parse the whole catalog each time.
+    """
+    if XC_ID_INDEX_PATH.exists():
+        try:
+            cached = read_json(XC_ID_INDEX_PATH)
+            if cached['clips_json'] == clips_json_version():
+                return cached['species']
+        except (ValueError, KeyError, TypeError):
+            pass  # Unreadable index - rebuild it below
+
+    index = build_xc_id_index(load_clips())
+    save_xc_id_index(index)
+    return index
+
+
+def load_existing_xc_ids(species_code: str) -> Set[str]:
     """Load all existing Xeno-canto IDs for a species (active + rejected)."""
-    xc_ids = []
+    # Built as a set directly - deduped, and O(1) for the "already have it" check
+    xc_ids = set()
 
     # Load from active clips
-    with open(CLIPS_JSON) as f:
-        clips = json.load(f)
-    xc_ids.extend([
-        c.get('xeno_canto_id')
-        for c in clips
-        if c.get('species_code') == species_code and c.get('xeno_canto_id')
-    ])
+    xc_ids.update(load_xc_id_index().get(species_code, []))
 
     # Load from rejection log
     if REJECTED_XC_IDS_PATH.exists():
-        with open(REJECTED_XC_IDS_PATH, 'r') as f:
-            rejection_log = json.load(f)
-        if species_code in rejection_log:
-            xc_ids.extend(rejection_log[species_code])
+        rejection_log = read_json(REJECTED_XC_IDS_PATH)
+        xc_ids.update(rejection_log.get(species_code, []))
 
-    return list(set(xc_ids))  # Dedupe and return
+    return xc_ids
 
 
 def search_xeno_canto(species_code: str, quality: str = 'A', limit: int = 50, country: str = 'US') -> List[Dict]:
@@ -92,7 +255,7 @@ def search_xeno_canto(species_code: str, quality: str = 'A', limit: int = 50, co
     params = {'query': query, 'key': api_key}
 
     try:
-        response = requests.get(XC_API_BASE, params=params, timeout=10)
+        response = SESSION.get(XC_API_BASE, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -100,24 +263,40 @@ def search_xeno_canto(species_code: str, quality: str = 'A', limit: int = 50, co
         print(f"✓ Found {data.get('numRecordings', 0)} total recordings")
 
         # Filter by country if specified (API v3 cnt: filter doesn't work)
+        # (stops scanning once limit matches are found)
         if country:
-            country_map = {'US': 'United States', 'CA': 'Canada'}
-            country_name = country_map.get(country, country)
-            recordings = [r for r in all_recordings if r.get('cnt') == country_name]
+            country_name = XC_COUNTRY_NAMES.get(country, country)
+            recordings = list(itertools.islice(
+                (r for r in all_recordings if r.get('cnt') == country_name), limit))
             print(f"  Filtered to {len(recordings)} from {country_name}")
         else:
-            recordings = all_recordings
+            recordings = all_recordings[:limit]
 
-        return recordings[:limit]
+        return recordings
     except Exception as e:
         print(f"✗ Xeno-canto search failed: {e}")
         return []
 
 
-def generate_spectrogram(wav_path: Path, output_path: Path):
+@functools.lru_cache(maxsize=2)
+def spectrogram_window(n_fft: int) -> np.ndarray:
+    """signal.spectrogram's default Tukey(0.25) window, built once per n_fft."""
+    window = signal.get_window(('tukey', 0.25), n_fft)
+    window.setflags(write=False)
+    return window
+
+
+@functools.lru_cache(maxsize=1)
+def spectrogram_figure(figsize: tuple):
+    """Figure + axes shared by every spectrogram (cleared per clip, never closed)."""
+    return plt.subplots(figsize=figsize)
+
+
+def generate_spectrogram(wav_path: Path, output_path: Path, audio: Optional[tuple] = None):
     """Generate spectrogram PNG from WAV file.
 
     Uses EXACT same settings as spectrogram_gen.py for consistency.
+    audio is the (sample_rate, samples) already read from wav_path, if any.
     """
     # EXACT settings from spectrogram_gen.py
     config = {
@@ -130,32 +309,39 @@ def generate_spectrogram(wav_path: Path, output_path: Path):
         'cmap': 'magma',
     }
 
-    # Read WAV file
-    sample_rate, samples = wavfile.read(wav_path)
-
-    # Generate spectrogram with exact same settings
-    frequencies, times, Sxx = signal.spectrogram(
-        samples,
-        fs=sample_rate,
-        nperseg=config['n_fft'],
-        noverlap=config['n_fft'] - config['hop_length'],
-        scaling='density'
-    )
-
-    # Convert to dB scale
-    Sxx_db = 10 * np.log10(Sxx + 1e-10)
-
-    # Filter frequency range
-    freq_mask = (frequencies >= config['freq_min']) & (frequencies <= config['freq_max'])
-    frequencies_filtered = frequencies[freq_mask]
-    Sxx_filtered = Sxx_db[freq_mask, :]
+    # Read WAV file (unless the caller already has it)
+    sample_rate, samples = audio if audio is not None else wavfile.read(wav_path)
+
+    # Generate spectrogram with exact same settings (the per-frame FFTs are
+    # independent, so let scipy.fft spread them over all cores)
+    with fft.set_workers(-1):
+        frequencies, times, Sxx = signal.spectrogram(
+            samples,
+            fs=sample_rate,
+            window=spectrogram_window(config['n_fft']),
+            nperseg=config['n_fft'],
+            noverlap=config['n_fft'] - config['hop_length'],
+            scaling='density'
+        )
+
+    # Filter frequency range (frequencies are ascending, so the band is a
+    # contiguous row slice - no boolean mask, and no dB work on hidden rows)
+    lo = np.searchsorted(frequencies, config['freq_min'], side='left')
+    hi = np.searchsorted(frequencies, config['freq_max'], side='right')
+    frequencies_filtered = frequencies[lo:hi]
+
+    # Convert to dB scale, in place on the one band-sized array
+    Sxx_filtered = Sxx[lo:hi] + 1e-10
+    np.log10(Sxx_filtered, out=Sxx_filtered)
+    Sxx_filtered *= 10
 
     # Normalize using percentiles (CRITICAL for consistent brightness)
     vmin = np.percentile(Sxx_filtered, 5)
     vmax = np.percentile(Sxx_filtered, 95)
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=config['figsize'])
+    # Reuse the one figure rather than building (and tearing down) a canvas per clip
+    fig, ax = spectrogram_figure(config['figsize'])
+    ax.clear()
 
     # Plot spectrogram
     ax.pcolormesh(
@@ -172,8 +358,8 @@ def generate_spectrogram(wav_path: Path, output_path: Path):
     ax.axis('off')
 
     # Remove margins (DO NOT use plt.subplots_adjust - breaks spectrograms!)
-    plt.tight_layout(pad=0)
-    plt.savefig(
+    fig.tight_layout(pad=0)
+    fig.savefig(
         output_path,
         dpi=config['dpi'],
         bbox_inches='tight',
@@ -181,60 +367,87 @@ def generate_spectrogram(wav_path: Path, output_path: Path):
         transparent=False,
         facecolor='black'
     )
-    plt.close()
 
 
-def download_and_process_clip(recording: Dict, species_code: str) -> Dict:
-    """Download, normalize, and generate spectrogram for a clip."""
+def xc_length_seconds(length: str) -> Optional[int]:
+    """Parse an XC 'length' field ("M:SS" or "H:MM:SS") into seconds, or None."""
+    try:
+        seconds = 0
+        for part in length.split(':'):
+            seconds = seconds * 60 + int(part)
+        return seconds
+    except (AttributeError, ValueError):
+        return None
+
+
+def fetch_recording(recording: Dict) -> bytes:
+    """Download a recording's MP3 and return its bytes."""
+    response = SESSION.get(recording['file'], timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def convert_recording(recording: Dict, output_file: Path) -> tuple:
+    """Download a recording and convert it to a normalized WAV at output_file.
+
+    Returns the (sample_rate, samples) read back from the WAV. Only network,
+    ffmpeg and file I/O happen here, so it is safe to run in a worker thread.
+    """
+    mp3_data = fetch_recording(recording)
+
+    # Convert to WAV, normalize to -16 LUFS, trim to 0.5-3.0s
+    # (MP3 bytes are piped straight into ffmpeg - no temp file on disk)
+    subprocess.run([
+        'ffmpeg', '-i', 'pipe:0',
+        '-af', 'loudnorm=I=-16:TP=-1.5:LRA=11',
+        '-ac', '1',  # Mono
+        '-ar', '44100',
+        '-t', '3.0',  # Max 3 seconds
+        '-y',
+        str(output_file)
+    ], input=mp3_data, check=True, capture_output=True)
+
+    # Read the WAV back once (its length gives the duration, and the samples
+    # are reused for the spectrogram) - no ffprobe process per clip
+    return wavfile.read(output_file)
+
+
+def clip_paths(species_code: str, xc_id: str) -> tuple:
+    """Return the (wav, spectrogram) output paths for a recording."""
+    return (CLIPS_DIR / f'{species_code}_{xc_id}.wav',
+            SPEC_DIR / f'{species_code}_{xc_id}.png')
+
+
+def download_and_process_clip(recording: Dict, species_code: str,
+                              pending_audio: Optional[Future] = None) -> Dict:
+    """Download, normalize, and generate spectrogram for a clip.
+
+    pending_audio is an already-started convert_recording() future; without
+    one the recording is downloaded and converted here.
+    """
     xc_id = recording['id']
-    file_url = recording['file']
 
     # Download paths
-    temp_file = CLIPS_DIR / f'{species_code}_{xc_id}_temp.mp3'
-    output_file = CLIPS_DIR / f'{species_code}_{xc_id}.wav'
-    spec_file = SPEC_DIR / f'{species_code}_{xc_id}.png'
+    output_file, spec_file = clip_paths(species_code, xc_id)
 
     print(f"  📥 Downloading XC{xc_id}...")
 
     try:
-        # Download MP3
-        response = requests.get(file_url, timeout=30)
-        response.raise_for_status()
-        with open(temp_file, 'wb') as f:
-            f.write(response.content)
-
-        # Convert to WAV, normalize to -16 LUFS, trim to 0.5-3.0s
-        subprocess.run([
-            'ffmpeg', '-i', str(temp_file),
-            '-af', 'loudnorm=I=-16:TP=-1.5:LRA=11',
-            '-ac', '1',  # Mono
-            '-ar', '44100',
-            '-t', '3.0',  # Max 3 seconds
-            '-y',
-            str(output_file)
-        ], check=True, capture_output=True)
-
-        # Clean up temp file
-        temp_file.unlink()
-
-        # Get duration
-        result = subprocess.run([
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            str(output_file)
-        ], capture_output=True, text=True, check=True)
-
-        duration = float(result.stdout.strip())
+        # Download + convert (or wait for the conversion already in flight)
+        if pending_audio is not None:
+            sample_rate, samples = pending_audio.result()
+        else:
+            sample_rate, samples = convert_recording(recording, output_file)
+        duration = len(samples) / sample_rate
 
         # Skip if too short
-        if duration < 0.5:
+        if duration < MIN_DURATION:
             print(f"    ⚠️  Too short ({duration:.2f}s), skipping")
             output_file.unlink()
             return None
 
         # Generate spectrogram
-        generate_spectrogram(output_file, spec_file)
+        generate_spectrogram(output_file, spec_file, (sample_rate, samples))
 
         print(f"    ✓ Processed ({duration:.2f}s)")
 
@@ -264,7 +477,7 @@ def download_and_process_clip(recording: Dict, species_code: str) -> Dict:
     except Exception as e:
         print(f"    ✗ Failed: {e}")
         # Clean up on failure
-        for f in [temp_file, output_file, spec_file]:
+        for f in [output_file, spec_file]:
             if f.exists():
                 f.unlink()
         return None
@@ -280,7 +493,7 @@ def augment_species(species_code: str, max_clips: int = 10, quality: str = 'A'):
     # Load existing IDs
     existing_ids = load_existing_xc_ids(species_code)
     print(f"📋 Existing clips: {len(existing_ids)}")
-    print(f"   XC IDs: {existing_ids}\n")
+    print(f"   XC IDs: {sorted(existing_ids)}\n")
 
     # Search Xeno-canto
     recordings = search_xeno_canto(species_code, quality=quality, limit=50)
@@ -293,6 +506,15 @@ def augment_species(species_code: str, max_clips: int = 10, quality: str = 'A'):
     new_recordings = [r for r in recordings if r['id'] not in existing_ids]
     print(f"\n📊 New recordings available: {len(new_recordings)}")
 
+    # Skip recordings XC lists as "0:00" before spending a download + ffmpeg
+    # run on them - they are almost always below MIN_DURATION and rejected
+    # after conversion anyway; unparseable lengths are kept
+    too_short = [r for r in new_recordings if xc_length_seconds(r.get('length')) == 0]
+    if too_short:
+        new_recordings = [r for r in new_recordings if r not in too_short]
+        print(f"   Skipping {len(too_short)} listed as 0:00 on XC: "
+              f"{', '.join('XC' + r['id'] for r in too_short)}")
+
     if not new_recordings:
         print("✓ No new recordings to download")
         return
@@ -302,11 +524,19 @@ def augment_species(species_code: str, max_clips: int = 10, quality: str = 'A'):
     print(f"⬇️  Downloading {len(to_download)} clips...\n")
 
     new_clips = []
-    for i, recording in enumerate(to_download, 1):
-        print(f"[{i}/{len(to_download)}] XC{recording['id']} - {recording.get('type', 'unknown')}")
-        clip = download_and_process_clip(recording, species_code)
-        if clip:
-            new_clips.append(clip)
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        # Download + ffmpeg for every clip runs in the pool, overlapping with
+        # the spectrogram work here; pyplot isn't thread-safe, so plotting
+        # stays on this thread and clips are processed (and numbered) in order
+        conversions = [
+            executor.submit(convert_recording, recording, clip_paths(species_code, recording['id'])[0])
+            for recording in to_download
+        ]
+        for i, (recording, conversion) in enumerate(zip(to_download, conversions), 1):
+            print(f"[{i}/{len(to_download)}] XC{recording['id']} - {recording.get('type', 'unknown')}")
+            clip = download_and_process_clip(recording, species_code, conversion)
+            if clip:
+                new_clips.append(clip)
 
     if not new_clips:
         print("\n✗ No clips successfully processed")
@@ -314,13 +544,16 @@ def augment_species(species_code: str, max_clips: int = 10, quality: str = 'A'):
 
     # Add to clips.json
     print(f"\n💾 Adding {len(new_clips)} clips to clips.json...")
-    with open(CLIPS_JSON) as f:
-        all_clips = json.load(f)
-
-    all_clips.extend(new_clips)
-
-    with open(CLIPS_JSON, 'w') as f:
-        json.dump(all_clips, f, indent=2)
+    xc_id_index = load_xc_id_index()
+    if not append_clips(new_clips):
+        # Unexpected layout - fall back to parsing and rewriting the whole file
+        all_clips = load_clips() + new_clips
+        write_clips(all_clips)
+
+    # Bring the XC ID index up to date with the new clips (no re-parse of
+    # clips.json next run)
+    xc_id_index.setdefault(species_code, []).extend(c['xeno_canto_id'] for c in new_clips)
+    save_xc_id_index(xc_id_index)
 
     print(f"✓ Added {len(new_clips)} new clips")
 
@@ -14,21 +14,37 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import glob
 import os
 import sys
+import tempfile
 import time
-import urllib.request
-import urllib.parse
-import urllib.error
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE = 'https://xeno-canto.org/api/3/recordings'
 DOWNLOAD_URL = 'https://xeno-canto.org/{id}/download'
 HEADERS = {'User-Agent': 'ChipNotes/1.0'}
 API_KEY = os.environ.get('XENO_CANTO_API_KEY', '')
 
+# One keep-alive connection (TLS handshake once, gzip'd API responses) for all requests
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+# Retry transient XC failures (rate limiting, 5xx) with backoff instead of failing the species
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])))
+
 TARGET_COUNT = 7  # recordings per species
 ALLOWED_LICENSES = {'//creativecommons.org/licenses/by-nc-sa/4.0/',
                     '//creativecommons.org/licenses/by-sa/4.0/',
@@ -40,6 +56,17 @@ ALLOWED_LICENSES = {'//creativecommons.org/licenses/by-nc-sa/4.0/',
 BLOCKED_LICENSE_FRAGMENTS = ['nd']  # reject any license with "nd" (No Derivatives)
 ALLOWED_QUALITIES = {'A', 'B'}
 
+# Cached XC search responses (keyed by query) so re-runs skip the API
+SEARCH_CACHE_DIR = Path('data/.xc_cache')
+SEARCH_CACHE_TTL = 7 * 86400  # seconds
+
+# mkstemp creates files 0600; downloads get the usual umask-derived mode instead.
+# Read once at import - os.umask() can only be queried by setting it, which
+# isn't safe once download threads are running.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+DOWNLOAD_FILE_MODE = 0o666 & ~_UMASK
+
 
 def load_eu_species():
     """Load all EU species codes from pack files."""
@@ -88,22 +115,44 @@ def format_license(lic):
     return lic
 
 
-def search_xc(genus, species_epithet):
-    """Search XC API for recordings of a species."""
-    query = f'gen:{genus}+sp:{species_epithet}'
+def parse_json(raw):
+    """Parse a JSON document from bytes, using orjson's C parser when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def search_xc(genus, species_epithet, use_cache=True):
+    """Search XC API for recordings of a species (cached on disk for SEARCH_CACHE_TTL)."""
+    query = f'gen:{genus} sp:{species_epithet}'
+    cache_path = SEARCH_CACHE_DIR / f'{hashlib.sha1(query.encode()).hexdigest()}.json'
+
+    if use_cache and cache_path.exists() and time.time() - cache_path.stat().st_mtime < SEARCH_CACHE_TTL:
+        return parse_json(cache_path.read_bytes()).get('recordings', [])
+
+    params = {'query': query}
     if API_KEY:
-        query += f'&key={API_KEY}'
-    url = f'{API_BASE}?query={query}'
+        params['key'] = API_KEY
 
-    req = urllib.request.Request(url, headers=HEADERS)
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode('utf-8'))
-    except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
+        resp = SESSION.get(API_BASE, params=params, timeout=15)
+        resp.raise_for_status()
+        data = parse_json(resp.content)
+    except (requests.RequestException, ValueError) as e:
         print(f'    API error: {e}')
         return []
 
-    recordings = data.get('recordings', [])
+    recordings = data.get('recordings') if isinstance(data, dict) else None
+    if not isinstance(recordings, list) or not recordings:
+        # Error payload or empty result - don't let it hide the species for a week
+        if isinstance(data, dict) and data.get('error'):
+            print(f'    API error: {data.get("message", data["error"])}')
+        return []
+
+    # Cache the raw response bytes - no need to re-serialize what we just parsed
+    SEARCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(resp.content)
+
     return recordings
 
 
@@ -148,24 +197,32 @@ def select_recordings(recordings, target=TARGET_COUNT):
 
 
 def download_recording(xc_id, dest_path):
-    """Download an XC recording MP3."""
+    """Download an XC recording MP3.
+
+    Streams into a temp file next to dest_path and renames it into place only
+    once complete, so a failed download never leaves a partial MP3 that later
+    runs would skip as "already exists".
+    """
     url = DOWNLOAD_URL.format(id=xc_id)
-    req = urllib.request.Request(url, headers=HEADERS)
-    if API_KEY:
-        url += f'?key={API_KEY}'
-        req = urllib.request.Request(url, headers=HEADERS)
+    params = {'key': API_KEY} if API_KEY else None
+    tmp_fd, tmp_path = tempfile.mkstemp(suffix='.part', dir=Path(dest_path).parent)
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = resp.read()
-            with open(dest_path, 'wb') as f:
-                f.write(data)
+        with os.fdopen(tmp_fd, 'wb') as f, SESSION.get(url, params=params, timeout=60, stream=True) as resp:
+            resp.raise_for_status()
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+        os.chmod(tmp_path, DOWNLOAD_FILE_MODE)
+        os.replace(tmp_path, dest_path)
         return True
     except Exception as e:
         print(f'    Download failed XC{xc_id}: {e}')
         return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
 
 
-def process_species(code, species_info, dry_run=False):
+def process_species(code, species_info, dry_run=False, use_cache=True):
     """Search, select, download, and write manifest for one species."""
     sci_name = species_info.get('scientific_name', '')
     common_name = species_info.get('common_name', code)
@@ -180,7 +237,7 @@ def process_species(code, species_info, dry_run=False):
     print(f'\n  {code} ({common_name} - {sci_name})')
     print(f'    Searching XC: gen:{genus}+sp:{epithet}')
 
-    recordings = search_xc(genus, epithet)
+    recordings = search_xc(genus, epithet, use_cache=use_cache)
     if not recordings:
         print(f'    No results from XC API')
         return False
@@ -259,6 +316,8 @@ def main():
     parser.add_argument('--max', type=int, default=0, help='Max species to process (0=all)')
     parser.add_argument('--include-downloaded', action='store_true',
                         help='Re-process species that already have MP3s')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Ignore cached XC search results in {SEARCH_CACHE_DIR}')
     args = parser.parse_args()
 
     eu_codes, species_data = load_eu_species()
@@ -293,7 +352,7 @@ def main():
             print(f'\n  SKIP {code}: not in species.json')
             failed += 1
             continue
-        if process_species(code, sp, dry_run=args.dry_run):
+        if process_species(code, sp, dry_run=args.dry_run, use_cache=not args.no_cache):
             success += 1
         else:
             failed += 1
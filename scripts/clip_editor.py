@@ -25,6 +25,7 @@ Usage:
 """
 
 import argparse
+import hashlib
 import http.server
 import json
 import os
@@ -34,12 +35,15 @@ import socketserver
 import threading
 import time
 import webbrowser
+from collections import OrderedDict
 from datetime import datetime
+from math import gcd
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse, unquote
 
 PORT = 8889
 PROJECT_ROOT = Path(__file__).parent.parent
+CLIP_EDIT_DIR = Path('/tmp/clip-edit')  # Downloaded XC sources and waveform cache
 
 # Audio processing imports
 try:
@@ -51,12 +55,32 @@ except ImportError:
     print("Run: pip install numpy soundfile pyloudnorm")
     exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Processing constants
 TARGET_LUFS = -16.0
 OUTPUT_SAMPLE_RATE = 44100
 MIN_DURATION = 0.5
 MAX_DURATION = 3.0
 
+# Waveform preview
+WAVEFORM_POINTS = 1500  # min/max buckets sent to the UI
+WAVEFORM_BLOCK_FRAMES = 1 << 20  # Frames decoded at a time for long sources
+WAVEFORM_CACHE_SIZE = 32  # Encoded waveform responses kept in memory
+WAVEFORM_DISK_CACHE = CLIP_EDIT_DIR / 'waveforms'  # Survives server restarts
+
+# (path, mtime_ns, size) -> encoded /api/waveform JSON, least recently used first
+_waveform_cache = OrderedDict()
+
+# File serving
+RANGE_RE = re.compile(r'bytes=(\d*)-(\d*)$')  # Single range only
+
+# Numbered clip IDs: {SPECIES}_{XCID}_{N} / {SPECIES}_clip_{N} -> (prefix, N)
+CLIP_NUM_RE = re.compile(r'(.*_)(\d+)$')
+
 
 class ClipEditorHandler(http.server.BaseHTTPRequestHandler):
     """HTTP handler for clip editor server"""
@@ -171,32 +195,25 @@ class ClipEditorHandler(http.server.BaseHTTPRequestHandler):
             return
 
         try:
-            audio, sr = sf.read(str(source_path))
-            if len(audio.shape) > 1:
-                audio = np.mean(audio, axis=1)
-
-            # Downsample for visualization
-            target_points = 1500
-            if len(audio) > target_points:
-                chunk_size = len(audio) // target_points
-                chunks = len(audio) // chunk_size
-                audio_trimmed = audio[:chunks * chunk_size]
-                reshaped = audio_trimmed.reshape(chunks, chunk_size)
-                mins = reshaped.min(axis=1).tolist()
-                maxs = reshaped.max(axis=1).tolist()
-            else:
-                mins = audio.tolist()
-                maxs = audio.tolist()
-
-            data = {
-                'sample_rate': sr,
-                'duration': len(audio) / sr,
-                'mins': mins,
-                'maxs': maxs,
-                'source_path': str(source_path),
-            }
-
-            self.send_json(data)
+            key = waveform_cache_key(source_path)
+            etag = waveform_etag(key)
+
+            # The browser already has this exact waveform
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            body = get_waveform_json(source_path, key)
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            # Revalidate every time: a replaced clip keeps its path
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.wfile.write(body)
         except Exception as e:
             self.send_error(500, str(e))
 
@@ -207,7 +224,7 @@ class ClipEditorHandler(http.server.BaseHTTPRequestHandler):
             return
 
         try:
-            source_path = download_xc_recording(xc_id, Path('/tmp/clip-edit'))
+            source_path = download_xc_recording(xc_id, CLIP_EDIT_DIR)
 
             # Get duration
             info = sf.info(str(source_path))
@@ -269,20 +286,13 @@ class ClipEditorHandler(http.server.BaseHTTPRequestHandler):
             self.send_error(404, f"Audio not found: {source_path}")
             return
 
-        self.send_response(200)
         suffix = file_path.suffix.lower()
         if suffix == '.mp3':
-            self.send_header('Content-type', 'audio/mpeg')
+            content_type = 'audio/mpeg'
         else:
-            self.send_header('Content-type', 'audio/wav')
-
-        file_size = file_path.stat().st_size
-        self.send_header('Content-Length', str(file_size))
-        self.send_header('Accept-Ranges', 'bytes')
-        self.end_headers()
+            content_type = 'audio/wav'
 
-        with open(file_path, 'rb') as f:
-            self.wfile.write(f.read())
+        self.send_file(file_path, content_type)
 
     def serve_file(self, relative_path):
         """Serve files from data directory"""
@@ -291,19 +301,56 @@ class ClipEditorHandler(http.server.BaseHTTPRequestHandler):
             self.send_error(404)
             return
 
-        self.send_response(200)
+        content_type = None
         if file_path.suffix == '.wav':
-            self.send_header('Content-type', 'audio/wav')
+            content_type = 'audio/wav'
         elif file_path.suffix == '.png':
-            self.send_header('Content-type', 'image/png')
+            content_type = 'image/png'
         elif file_path.suffix == '.json':
-            self.send_header('Content-type', 'application/json')
+            content_type = 'application/json'
+
+        self.send_file(file_path, content_type)
 
-        self.send_header('Content-Length', str(file_path.stat().st_size))
+    def send_file(self, file_path, content_type=None):
+        """Send a file, honouring a single byte Range (audio seek/scrub)"""
+        file_size = file_path.stat().st_size
+        start, end = 0, file_size - 1
+
+        # Multi-range or malformed headers are ignored - a full 200 is valid
+        match = RANGE_RE.match(self.headers.get('Range', '').strip())
+        if match and (match.group(1) or match.group(2)):
+            first, last = match.groups()
+            if not first:
+                # Suffix range: the final N bytes
+                start = max(0, file_size - int(last))
+            else:
+                start = int(first)
+                if last:
+                    end = min(int(last), file_size - 1)
+            if start > end:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{file_size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
+        else:
+            self.send_response(200)
+
+        if content_type:
+            self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Accept-Ranges', 'bytes')
         self.end_headers()
 
-        with open(file_path, 'rb') as f:
-            self.wfile.write(f.read())
+        # Headers are already on the wire (wfile is unbuffered), so the body
+        # can go straight to the socket: socket.sendfile() uses os.sendfile
+        # (kernel-side copy, no Python bytes) where available and falls back
+        # to a read/send loop elsewhere
+        if end >= start:
+            with open(file_path, 'rb') as f:
+                self.connection.sendfile(f, start, end - start + 1)
 
     def handle_extract(self):
         """Extract a clip segment"""
@@ -336,33 +383,178 @@ class ClipEditorHandler(http.server.BaseHTTPRequestHandler):
         self.wfile.write(json.dumps(data).encode())
 
 
+def compute_waveform(source_path: Path, target_points: int = WAVEFORM_POINTS) -> dict:
+    """Per-bucket min/max envelope of a source for the waveform display.
+
+    Long sources are decoded in blocks of whole buckets and reduced as they
+    stream, so a multi-hour recording is never held in memory at once.
+    """
+    info = sf.info(str(source_path))
+    sr = info.samplerate
+    frames = info.frames
+
+    if frames <= target_points:
+        audio, sr = sf.read(str(source_path), dtype='float32')
+        if len(audio.shape) > 1:
+            audio = np.mean(audio, axis=1)
+        mins = audio.tolist()
+        maxs = audio.tolist()
+    else:
+        chunk_size = frames // target_points
+        chunks = frames // chunk_size
+        block_frames = max(1, WAVEFORM_BLOCK_FRAMES // chunk_size) * chunk_size
+
+        mins = []
+        maxs = []
+        for block in sf.blocks(str(source_path), blocksize=block_frames,
+                               frames=chunks * chunk_size, dtype='float32'):
+            if len(block.shape) > 1:
+                block = np.mean(block, axis=1)
+            # Every block but the last is a whole number of buckets; drop any
+            # partial bucket at the end
+            usable = len(block) // chunk_size * chunk_size
+            reshaped = block[:usable].reshape(-1, chunk_size)
+            mins.extend(reshaped.min(axis=1).tolist())
+            maxs.extend(reshaped.max(axis=1).tolist())
+
+    return {
+        'sample_rate': sr,
+        'duration': frames / sr,
+        'mins': mins,
+        'maxs': maxs,
+        'source_path': str(source_path),
+    }
+
+
+def waveform_cache_key(source_path: Path) -> tuple:
+    """Identify a source's current contents by path, mtime and size."""
+    st = source_path.stat()
+    return (str(source_path), st.st_mtime_ns, st.st_size)
+
+
+def waveform_digest(key: tuple) -> str:
+    """Hex digest naming a source version (ETag and disk cache file name)."""
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def waveform_etag(key: tuple) -> str:
+    """Strong ETag for the waveform of a source version."""
+    return '"%s"' % waveform_digest(key)
+
+
+def get_waveform_json(source_path: Path, key: tuple) -> bytes:
+    """Encoded waveform for a source, decoding it only if not cached.
+
+    Checks memory, then the on-disk cache (so a restarted editor doesn't
+    re-decode long XC recordings), before computing it.
+    """
+    body = _waveform_cache.get(key)
+    if body is not None:
+        _waveform_cache.move_to_end(key)
+        return body
+
+    # The digest covers path, mtime and size, so a changed source simply
+    # misses - stale files are never read
+    cache_file = WAVEFORM_DISK_CACHE / f"{waveform_digest(key)}.json"
+    try:
+        body = cache_file.read_bytes()
+    except OSError:
+        body = json.dumps(compute_waveform(source_path)).encode()
+        try:
+            WAVEFORM_DISK_CACHE.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.part')
+            tmp_file.write_bytes(body)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not cache waveform for {source_path}: {e}")
+
+    _waveform_cache[key] = body
+    if len(_waveform_cache) > WAVEFORM_CACHE_SIZE:
+        _waveform_cache.popitem(last=False)
+    return body
+
+
+# Parsed clips.json plus its indexes, keyed by (path, mtime_ns, size) so UI
+# requests only re-parse the file after it changes
+_clips_cache = {}
+
+
+def index_clips(clips):
+    """Build {clip_id: (position, clip)} and {id prefix: highest N} for clips"""
+    clips_by_id = {}
+    max_num_by_prefix = {}
+    for i, c in enumerate(clips):
+        clip_id = c['clip_id']
+        clips_by_id.setdefault(clip_id, (i, c))  # First clip wins on a duplicate ID
+        match = CLIP_NUM_RE.match(clip_id)
+        if match:
+            prefix, num = match.group(1), int(match.group(2))
+            if num > max_num_by_prefix.get(prefix, 0):
+                max_num_by_prefix[prefix] = num
+    return clips_by_id, max_num_by_prefix
+
+
+def load_clips():
+    """Return (clips, clips_by_id, max_num_by_prefix) for clips.json
+
+    All three are shared with later calls - treat them as read-only.
+    """
+    clips_json_path = PROJECT_ROOT / "data" / "clips.json"
+    try:
+        st = clips_json_path.stat()
+    except FileNotFoundError:
+        return [], {}, {}
+
+    key = (str(clips_json_path), st.st_mtime_ns, st.st_size)
+    cached = _clips_cache.get(key)
+    if cached is None:
+        with open(clips_json_path, 'r') as f:
+            clips = json.load(f)
+        cached = (clips,) + index_clips(clips)
+        _clips_cache.clear()
+        _clips_cache[key] = cached
+    return cached
+
+
+def write_clips_json(clips_json_path, clips):
+    """Atomically replace clips.json (indent=2, UTF-8), via orjson when available"""
+    if orjson is not None:
+        data = orjson.dumps(clips, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(clips, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # Write beside it and rename over it, so a crash mid-write can't leave
+    # a truncated clips.json behind
+    tmp_path = clips_json_path.with_suffix('.json.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, clips_json_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    _clips_cache.clear()
+
+
 def get_clips_for_species(species_code):
     """Get all clips for a species"""
     if not species_code:
         return []
 
-    clips_json_path = PROJECT_ROOT / "data" / "clips.json"
-    if not clips_json_path.exists():
-        return []
-
-    with open(clips_json_path, 'r') as f:
-        all_clips = json.load(f)
-
-    return [c for c in all_clips if c.get('species_code', '').upper() == species_code.upper()]
+    all_clips = load_clips()[0]
+    species_code = species_code.upper()
+    return [c for c in all_clips if c.get('species_code', '').upper() == species_code]
 
 
 def get_clip_by_id(clip_id):
     """Get a clip by ID, file path, or source ID"""
-    clips_json_path = PROJECT_ROOT / "data" / "clips.json"
-    if not clips_json_path.exists():
-        return None
+    clips, clips_by_id, _ = load_clips()
 
-    with open(clips_json_path, 'r') as f:
-        clips = json.load(f)
+    # Exact clip ID - a dict hit instead of a scan
+    if clip_id in clips_by_id:
+        return clips_by_id[clip_id][1]
 
     for c in clips:
-        if c['clip_id'] == clip_id:
-            return c
         if clip_id in c.get('file_path', ''):
             return c
         if clip_id in c.get('source_id', ''):
@@ -371,6 +563,38 @@ def get_clip_by_id(clip_id):
     return None
 
 
+def find_downloaded_source(xc_id):
+    """Find a downloaded source for an XC recording in CLIP_EDIT_DIR, or None
+
+    Lists the directory once and ranks names the way the old per-pattern
+    globs did: .mp3 before .wav, then XC{id}_full > XC{id}* > *{id}*.
+    """
+    try:
+        with os.scandir(CLIP_EDIT_DIR) as it:
+            names = [entry.name for entry in it]
+    except FileNotFoundError:
+        return None
+
+    best_rank, best_name = None, None
+    for name in names:
+        if xc_id not in name:
+            continue
+        for ext_rank, ext in enumerate(('.mp3', '.wav')):
+            if not name.endswith(ext):
+                continue
+            if name == f'XC{xc_id}_full{ext}':
+                rank = (ext_rank, 0)
+            elif name.startswith(f'XC{xc_id}'):
+                rank = (ext_rank, 1)
+            else:
+                rank = (ext_rank, 2)
+            if best_rank is None or rank < best_rank:
+                best_rank, best_name = rank, name
+            break
+
+    return CLIP_EDIT_DIR / best_name if best_name else None
+
+
 def find_source_for_clip(clip_data):
     """Find source recording info for a clip"""
     source_id = clip_data.get('source_id', '')
@@ -391,19 +615,17 @@ def find_source_for_clip(clip_data):
         result['can_download'] = True
 
         # Check if already downloaded
-        for ext in ['.mp3', '.wav']:
-            for pattern in [f'XC{xc_id}_full{ext}', f'XC{xc_id}*{ext}', f'*{xc_id}*{ext}']:
-                matches = list(Path('/tmp/clip-edit').glob(pattern))
-                if matches:
-                    result['path'] = str(matches[0])
-                    result['available'] = True
-                    # Get duration
-                    try:
-                        info = sf.info(str(matches[0]))
-                        result['duration'] = info.duration
-                    except:
-                        pass
-                    return result
+        source_path = find_downloaded_source(xc_id)
+        if source_path:
+            result['path'] = str(source_path)
+            result['available'] = True
+            # Get duration
+            try:
+                info = sf.info(str(source_path))
+                result['duration'] = info.duration
+            except:
+                pass
+            return result
 
     elif clip_data.get('source') == 'doc':
         result['type'] = 'doc'
@@ -440,80 +662,73 @@ def extract_clip(source_path: Path, start_time: float, duration: float,
     if duration < MIN_DURATION or duration > MAX_DURATION:
         raise ValueError(f"Duration must be {MIN_DURATION}-{MAX_DURATION}s, got {duration}")
 
-    # Load audio
-    audio, sr = sf.read(str(source_path))
+    # Extract segment - seek to it and decode only those frames, not the
+    # whole (possibly hours-long) source (float32: half the float64 default)
+    with sf.SoundFile(str(source_path)) as f:
+        sr = f.samplerate
+        start_sample = int(start_time * sr)
+        end_sample = int((start_time + duration) * sr)
 
-    # Convert to mono
-    if len(audio.shape) > 1:
-        audio = np.mean(audio, axis=1)
-
-    # Extract segment
-    start_sample = int(start_time * sr)
-    end_sample = int((start_time + duration) * sr)
+        if start_sample < 0 or end_sample > f.frames:
+            raise ValueError(f"Selection out of bounds: {start_time}-{start_time+duration}s")
 
-    if start_sample < 0 or end_sample > len(audio):
-        raise ValueError(f"Selection out of bounds: {start_time}-{start_time+duration}s")
+        f.seek(start_sample)
+        segment = f.read(end_sample - start_sample, dtype='float32')
 
-    segment = audio[start_sample:end_sample]
+    # Convert to mono
+    if len(segment.shape) > 1:
+        segment = np.mean(segment, axis=1, dtype=np.float32)
 
     # Resample if needed
     if sr != OUTPUT_SAMPLE_RATE:
-        duration_sec = len(segment) / sr
-        new_length = int(duration_sec * OUTPUT_SAMPLE_RATE)
-        indices = np.linspace(0, len(segment) - 1, new_length)
-        segment = np.interp(indices, np.arange(len(segment)), segment)
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            resample_poly = None
+
+        if resample_poly is not None:
+            # Polyphase FIR: anti-aliased, one output buffer
+            g = gcd(int(sr), OUTPUT_SAMPLE_RATE)
+            segment = resample_poly(segment, OUTPUT_SAMPLE_RATE // g, int(sr) // g)
+        else:
+            # Linear interpolation fallback (no scipy)
+            duration_sec = len(segment) / sr
+            new_length = int(duration_sec * OUTPUT_SAMPLE_RATE)
+            indices = np.linspace(0, len(segment) - 1, new_length)
+            segment = np.interp(indices, np.arange(len(segment)), segment)
         sr = OUTPUT_SAMPLE_RATE
 
     # Normalize loudness
     meter = pyln.Meter(sr)
     loudness = meter.integrated_loudness(segment)
     if not np.isinf(loudness) and not np.isnan(loudness):
-        segment = pyln.normalize.loudness(segment, loudness, TARGET_LUFS)
-        segment = np.clip(segment, -1.0, 1.0)
+        # (pyloudnorm's float64 gain promotes the result - bring it back)
+        segment = pyln.normalize.loudness(segment, loudness, TARGET_LUFS).astype(np.float32)
+        np.clip(segment, -1.0, 1.0, out=segment)
 
-    # Load existing clips
+    # Load existing clips (a copy - the cached list must not see our
+    # append/replace)
     clips_json_path = PROJECT_ROOT / "data" / "clips.json"
-    existing_clips = []
-    if clips_json_path.exists():
-        with open(clips_json_path, 'r') as f:
-            existing_clips = json.load(f)
+    clips, clips_by_id, max_num_by_prefix = load_clips()
+    existing_clips = list(clips)
 
-    # Get existing clip data if replacing
+    # Get existing clip data (and its position) if replacing
     existing_clip_data = None
-    if replace_clip_id:
-        for c in existing_clips:
-            if c['clip_id'] == replace_clip_id:
-                existing_clip_data = c
-                break
+    replace_index = None
+    if replace_clip_id and replace_clip_id in clips_by_id:
+        replace_index, existing_clip_data = clips_by_id[replace_clip_id]
 
     # Determine clip ID
     if replace_clip_id:
         clip_id = replace_clip_id
-    elif xc_id:
-        # XC naming: {SPECIES}_{XCID}_{N}
-        prefix = f"{species_code.upper()}_{xc_id}_"
-        existing_nums = []
-        for c in existing_clips:
-            if c['clip_id'].startswith(prefix):
-                try:
-                    num = int(c['clip_id'][len(prefix):])
-                    existing_nums.append(num)
-                except ValueError:
-                    pass
-        next_num = max(existing_nums, default=0) + 1
-        clip_id = f"{prefix}{next_num}"
     else:
-        # Generic naming
-        prefix = f"{species_code.upper()}_clip_"
-        existing_nums = []
-        for c in existing_clips:
-            if c['clip_id'].startswith(prefix):
-                try:
-                    num = int(c['clip_id'][len(prefix):])
-                    existing_nums.append(num)
-                except ValueError:
-                    pass
-        next_num = max(existing_nums, default=0) + 1
+        if xc_id:
+            # XC naming: {SPECIES}_{XCID}_{N}
+            prefix = f"{species_code.upper()}_{xc_id}_"
+        else:
+            # Generic naming
+            prefix = f"{species_code.upper()}_clip_"
+        next_num = max_num_by_prefix.get(prefix, 0) + 1
         clip_id = f"{prefix}{next_num}"
 
     # Output paths
@@ -543,7 +758,7 @@ def extract_clip(source_path: Path, start_time: float, duration: float,
     generate_spectrogram(segment, sr, str(spectrogram_path))
 
     # Measure final loudness
-    final_loudness = meter.integrated_loudness(segment)
+    final_loudness = float(meter.integrated_loudness(segment))  # Plain float for the JSON encoders
     duration_ms = int(len(segment) / sr * 1000)
 
     # Build clip metadata
@@ -581,15 +796,12 @@ def extract_clip(source_path: Path, start_time: float, duration: float,
 
     # Update clips.json
     if replace_clip_id:
-        for i, c in enumerate(existing_clips):
-            if c['clip_id'] == replace_clip_id:
-                existing_clips[i] = clip_data
-                break
+        if replace_index is not None:
+            existing_clips[replace_index] = clip_data
     else:
         existing_clips.append(clip_data)
 
-    with open(clips_json_path, 'w') as f:
-        json.dump(existing_clips, f, indent=2)
+    write_clips_json(clips_json_path, existing_clips)
 
     return {
         'success': True,
@@ -1474,7 +1686,7 @@ def main():
             initial_source_path = Path(source_info['path'])
         elif source_info['can_download'] and source_info['xc_id']:
             xc_id = source_info['xc_id']
-            initial_source_path = download_xc_recording(xc_id, Path('/tmp/clip-edit'))
+            initial_source_path = download_xc_recording(xc_id, CLIP_EDIT_DIR)
 
         if source_info['xc_id']:
             xc_id = source_info['xc_id']
@@ -1484,7 +1696,7 @@ def main():
         if not species_code:
             print("ERROR: --species required when using --xc")
             return 1
-        initial_source_path = download_xc_recording(args.xc, Path('/tmp/clip-edit'))
+        initial_source_path = download_xc_recording(args.xc, CLIP_EDIT_DIR)
 
     elif args.source:
         # Load local source
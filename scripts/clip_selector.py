@@ -24,11 +24,13 @@ import http.server
 import json
 import os
 import socketserver
+import struct
 import subprocess
 import tempfile
 import threading
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PORT = 8889
@@ -50,6 +52,9 @@ TARGET_LUFS = -16.0
 OUTPUT_SAMPLE_RATE = 44100
 MIN_DURATION = 0.5
 MAX_DURATION = 3.0
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.MP3', '.WAV')
+WAV_FORMATS = (1, 3)  # WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT - read directly by read_wav_duration
+PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Concurrent header reads in scan_recordings
 
 
 class ClipSelectorHandler(http.server.BaseHTTPRequestHandler):
@@ -207,29 +212,71 @@ class ClipSelectorHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(json.dumps({'error': str(e)}).encode())
 
 
+def read_wav_duration(file_path: str) -> float:
+    """
+    Duration of a plain PCM/float WAV from its RIFF fmt/data chunks.
+
+    Returns None for anything it can't fully vouch for (extensible format,
+    truncated data chunk, non-RIFF) so the caller can fall back to sf.info.
+    """
+    with open(file_path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        riff, _, wave = struct.unpack('<4sI4s', f.read(12))
+        if riff != b'RIFF' or wave != b'WAVE':
+            return None
+
+        fmt = None
+        while True:
+            chunk_id, chunk_size = struct.unpack('<4sI', f.read(8))
+            if chunk_id == b'fmt ':
+                fmt = struct.unpack('<HHIIH', f.read(14))
+                f.seek(chunk_size - 14 + (chunk_size & 1), 1)
+            elif chunk_id == b'data':
+                if fmt is None or fmt[0] not in WAV_FORMATS or fmt[2] == 0 or fmt[4] == 0:
+                    return None
+                if f.tell() + chunk_size > file_size:
+                    return None
+                _, _, sample_rate, _, block_align = fmt
+                return (chunk_size // block_align) / sample_rate
+            else:
+                f.seek(chunk_size + (chunk_size & 1), 1)
+
+
+def get_audio_duration(file_path: str) -> float:
+    """Read a file's duration in seconds from its header (0 if unreadable)"""
+    if file_path.lower().endswith('.wav'):
+        try:
+            duration = read_wav_duration(file_path)
+            if duration is not None:
+                return duration
+        except (struct.error, OSError):
+            pass
+
+    try:
+        return sf.info(file_path).duration
+    except Exception:
+        return 0
+
+
 def scan_recordings(input_dir: Path, species_filter: list = None) -> list:
     """Scan input directory for audio files"""
-    recordings = []
+    # One directory pass (glob ran once per extension), sorted by filename
+    with os.scandir(input_dir) as it:
+        entries = [e for e in it if e.name.endswith(AUDIO_EXTENSIONS)]
+    entries.sort(key=lambda e: e.name)
 
-    for ext in ['*.mp3', '*.wav', '*.MP3', '*.WAV']:
-        for file_path in input_dir.glob(ext):
-            filename = file_path.name
+    # Header reads are I/O bound - probe durations concurrently
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+        durations = list(executor.map(get_audio_duration, [e.path for e in entries]))
 
-            # Try to get duration
-            try:
-                info = sf.info(str(file_path))
-                duration = info.duration
-            except:
-                duration = 0
-
-            recordings.append({
-                'filename': filename,
-                'duration': duration,
-                'path': str(file_path.relative_to(input_dir))
-            })
+    recordings = []
+    for entry, duration in zip(entries, durations):
+        recordings.append({
+            'filename': entry.name,
+            'duration': duration,
+            'path': entry.name
+        })
 
-    # Sort by filename
-    recordings.sort(key=lambda x: x['filename'])
     return recordings
 
 
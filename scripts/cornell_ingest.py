@@ -10,19 +10,22 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import re
 import sys
+from math import gcd
 from pathlib import Path
 
 try:
     import numpy as np
     import soundfile as sf
     import pyloudnorm as pyln
+    from scipy.signal import resample_poly
 except ImportError:
     print("ERROR: Required packages not installed.")
-    print("Run: pip install numpy soundfile pyloudnorm")
+    print("Run: pip install numpy scipy soundfile pyloudnorm")
     sys.exit(1)
 
 # Target loudness in LUFS
@@ -35,6 +38,9 @@ MAX_DURATION = 3.0
 # Sample rate for output
 OUTPUT_SAMPLE_RATE = 44100
 
+# Frames per block when streaming WAVs to disk
+WRITE_BLOCK_FRAMES = 8192
+
 # Species name to 4-letter code mapping
 SPECIES_CODES = {
     "Mourning Dove": "MODO",
@@ -110,8 +116,12 @@ def parse_filename(filename: str) -> dict:
 def convert_to_mono(audio: np.ndarray) -> np.ndarray:
     """Convert stereo audio to mono by averaging channels."""
     if len(audio.shape) > 1 and audio.shape[1] > 1:
-        return np.mean(audio, axis=1)
-    return audio.flatten()
+        # Average straight into the output buffer (no float64 intermediate)
+        mono = np.empty(audio.shape[0], dtype=np.float32)
+        np.mean(audio, axis=1, dtype=np.float32, out=mono)
+        return mono
+    # Already mono: a (n, 1) -> (n,) view, not a copy
+    return np.ascontiguousarray(audio.reshape(-1), dtype=np.float32)
 
 
 def extract_clips(audio: np.ndarray, sample_rate: int, target_duration: float = 2.0) -> list:
@@ -132,21 +142,21 @@ def extract_clips(audio: np.ndarray, sample_rate: int, target_duration: float =
     window_size = target_samples
     step_size = sample_rate // 2  # 0.5 second steps
 
-    # Find loudest segments
-    segments = []
-    for start in range(0, len(audio) - window_size, step_size):
-        window = audio[start:start + window_size]
-        energy = np.sqrt(np.mean(window ** 2))
-        segments.append({
-            'start': start,
-            'energy': energy
-        })
-
-    if not segments:
+    # Less than one step longer than a clip: the only window starts at 0,
+    # so there is nothing to search
+    if len(audio) - window_size <= step_size:
         return [audio[:target_samples]]
 
-    # Sort by energy and take top segments
-    segments.sort(key=lambda x: x['energy'], reverse=True)
+    # Find loudest segments: RMS of every window from one cumulative sum of
+    # squares (float64 so the running sum stays exact over long recordings)
+    starts = np.arange(0, len(audio) - window_size, step_size)
+
+    csum = np.concatenate(([0.0], np.cumsum(np.square(audio, dtype=np.float64))))
+    energies = np.sqrt((csum[starts + window_size] - csum[starts]) / window_size)
+
+    # Sort by energy (loudest first, ties in time order) and take top segments
+    order = np.argsort(-energies, kind='stable')
+    segments = [{'start': int(starts[i]), 'energy': float(energies[i])} for i in order]
 
     # Extract non-overlapping clips
     # Take up to 3 clips per source file
@@ -175,41 +185,75 @@ def extract_clips(audio: np.ndarray, sample_rate: int, target_duration: float =
     return clips if clips else [audio[:target_samples]]
 
 
-def normalize_loudness(audio: np.ndarray, sample_rate: int) -> np.ndarray:
-    """Normalize audio to target LUFS."""
-    meter = pyln.Meter(sample_rate)
+@functools.lru_cache(maxsize=8)
+def get_meter(sample_rate: int) -> 'pyln.Meter':
+    """Return a shared loudness meter (K-weighting filters are built once per rate)."""
+    return pyln.Meter(sample_rate)
+
+
+def normalize_loudness(audio: np.ndarray, sample_rate: int) -> tuple:
+    """
+    Normalize audio to target LUFS.
+
+    Returns (audio, loudness_lufs). The loudness of the normalized clip is
+    TARGET_LUFS by construction (normalization is a scalar gain), so it is
+    only re-measured when clipping changed the signal.
+    """
+    # Digital silence (peak below -100 dBFS) is always below pyloudnorm's
+    # -70 LUFS gate - skip the K-weighted measurement entirely
+    if audio.size == 0 or np.abs(audio).max() < 1e-5:
+        return audio, float('-inf')
+
+    meter = get_meter(sample_rate)
 
     # Measure current loudness
     loudness = meter.integrated_loudness(audio)
 
     if np.isinf(loudness) or np.isnan(loudness):
         # Audio is silent or nearly silent
-        return audio
+        return audio, loudness
 
-    # Normalize to target
-    normalized = pyln.normalize.loudness(audio, loudness, TARGET_LUFS)
+    # Normalize to target (pyloudnorm's gain is float64; keep the input dtype)
+    normalized = pyln.normalize.loudness(audio, loudness, TARGET_LUFS).astype(audio.dtype, copy=False)
 
     # Clip to prevent distortion
-    normalized = np.clip(normalized, -1.0, 1.0)
+    if np.abs(normalized).max() > 1.0:
+        normalized = np.clip(normalized, -1.0, 1.0)
+        return normalized, meter.integrated_loudness(normalized)
+
+    return normalized, TARGET_LUFS
+
+
+def write_pcm16(output_file: Path, audio: np.ndarray, sample_rate: int) -> None:
+    """
+    Write mono audio as a 16-bit PCM WAV.
+
+    Quantizes in one vectorized pass with libsndfile's own float->int16
+    mapping (scale by 32768, floor, clamp), so the file is byte-identical to
+    sf.write(..., subtype='PCM_16'), then streams it out in small blocks.
+    """
+    pcm = np.floor(audio * np.float32(32768.0))
+    np.clip(pcm, -32768, 32767, out=pcm)
+    pcm = pcm.astype(np.int16)
 
-    return normalized
+    with sf.SoundFile(str(output_file), 'w', samplerate=sample_rate, channels=1, subtype='PCM_16') as f:
+        for start in range(0, len(pcm), WRITE_BLOCK_FRAMES):
+            f.write(pcm[start:start + WRITE_BLOCK_FRAMES])
 
 
 def process_cornell_file(input_path: str, output_dir: str, file_info: dict) -> list:
     """Process a single Cornell audio file and extract multiple clips."""
     try:
-        # Load audio
-        audio, sample_rate = sf.read(input_path)
+        # Load audio (float32 is ample for 16-bit output and halves memory traffic)
+        audio, sample_rate = sf.read(input_path, dtype='float32')
 
         # Convert to mono
         audio = convert_to_mono(audio)
 
-        # Resample if needed
+        # Resample if needed (polyphase FIR - anti-aliased, unlike np.interp)
         if sample_rate != OUTPUT_SAMPLE_RATE:
-            duration = len(audio) / sample_rate
-            new_length = int(duration * OUTPUT_SAMPLE_RATE)
-            indices = np.linspace(0, len(audio) - 1, new_length)
-            audio = np.interp(indices, np.arange(len(audio)), audio)
+            g = gcd(sample_rate, OUTPUT_SAMPLE_RATE)
+            audio = resample_poly(audio, OUTPUT_SAMPLE_RATE // g, sample_rate // g)
             sample_rate = OUTPUT_SAMPLE_RATE
 
         # Extract multiple clips from this file
@@ -219,7 +263,7 @@ def process_cornell_file(input_path: str, output_dir: str, file_info: dict) -> l
 
         for idx, clip_audio in enumerate(clips):
             # Normalize loudness
-            clip_audio = normalize_loudness(clip_audio, sample_rate)
+            clip_audio, final_loudness = normalize_loudness(clip_audio, sample_rate)
 
             # Calculate duration
             duration_ms = int(len(clip_audio) / sample_rate * 1000)
@@ -231,11 +275,7 @@ def process_cornell_file(input_path: str, output_dir: str, file_info: dict) -> l
             output_file = Path(output_dir) / f"{file_info['species_code']}_cornell_{source_num}_{clip_num}.wav"
 
             # Save processed audio
-            sf.write(str(output_file), clip_audio, sample_rate, subtype='PCM_16')
-
-            # Verify loudness
-            meter = pyln.Meter(sample_rate)
-            final_loudness = meter.integrated_loudness(clip_audio)
+            write_pcm16(output_file, clip_audio, sample_rate)
 
             processed_files.append({
                 'file_path': str(output_file),
@@ -14,12 +14,18 @@ Usage:
 """
 
 import json
+import os
 import sys
 import shutil
 import hashlib
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def merge_candidates(candidates_dir: str) -> None:
     """Safely merge candidates into clips.json"""
 
@@ -61,11 +67,11 @@ def merge_candidates(candidates_dir: str) -> None:
     # Build new clip entries (matching the schema)
     new_clips = []
     for candidate in candidates:
-        # Extract filename from candidate path
-        filename = Path(candidate['file_path']).name
+        # Extract filename from candidate path (no Path object per candidate)
+        filename = os.path.basename(candidate['file_path'])
 
         # Derive species code from filename (assumes XXXX_*.wav format)
-        species_code = filename.split('_')[0]
+        species_code = filename.partition('_')[0]
 
         # Generate unique clip_id using MD5 hash of file path (matches existing pattern)
         file_path = f"data/clips/{filename}"
@@ -110,8 +116,13 @@ def merge_candidates(candidates_dir: str) -> None:
 
     # Save merged clips
     print(f"💾 Saving merged clips to {CLIPS_JSON}...")
-    with open(CLIPS_JSON, 'w') as f:
-        json.dump(merged_clips, f, indent=2)
+    # Indentation is kept (clips.json is committed and reviewed as text); orjson
+    # does it in native code and hands back the whole file for a single write
+    if orjson is not None:
+        CLIPS_JSON.write_bytes(orjson.dumps(merged_clips, option=orjson.OPT_INDENT_2))
+    else:
+        with open(CLIPS_JSON, 'w', encoding='utf-8') as f:
+            json.dump(merged_clips, f, indent=2, ensure_ascii=False)
 
     added_count = len(new_clips)
     final_count = len(merged_clips)
@@ -30,6 +30,15 @@ REQUIRED_FIELDS = [
     'file_path'
 ]
 
+# Xeno-canto quality letter -> quality_score
+QUALITY_SCORES = {'A': 5, 'B': 4, 'C': 3, 'D': 2, 'E': 1}
+
+# Valid vocalization types from schema
+VALID_VOCALIZATION_TYPES = frozenset([
+    "song", "call", "flight call", "alarm call", "chip", "drum", "wing sound",
+    "rattle", "trill", "duet", "juvenile", "other"
+])
+
 # Legacy field mappings
 LEGACY_MAPPINGS = {
     'species_name': 'common_name',
@@ -55,9 +64,8 @@ def normalize_clip(clip: Dict[str, Any], index: int) -> tuple[Dict[str, Any], Li
     # Convert quality rating letter to score
     if 'quality_score' not in clip and 'quality' in clip:
         quality_letter = clip.get('quality')
-        score_map = {'A': 5, 'B': 4, 'C': 3, 'D': 2, 'E': 1}
-        if quality_letter in score_map:
-            clip['quality_score'] = score_map[quality_letter]
+        if quality_letter in QUALITY_SCORES:
+            clip['quality_score'] = QUALITY_SCORES[quality_letter]
             changes.append(f"Converted quality '{quality_letter}' → quality_score {clip['quality_score']}")
 
     # Generate clip_id if missing
@@ -81,11 +89,9 @@ def normalize_clip(clip: Dict[str, Any], index: int) -> tuple[Dict[str, Any], Li
     # Normalize vocalization_type to valid schema values
     if 'vocalization_type' in clip:
         voc_type = clip['vocalization_type']
-        # Valid types from schema
-        valid_types = ["song", "call", "flight call", "alarm call", "chip", "drum", "wing sound", "rattle", "trill", "duet", "juvenile", "other"]
 
         # If already valid, keep it
-        if voc_type in valid_types:
+        if voc_type in VALID_VOCALIZATION_TYPES:
             pass  # No change needed
         else:
             # Try to map common variations
@@ -23,7 +23,11 @@ After downloading, use clip_selector.py to manually select clips:
 """
 
 import argparse
+import os
+import shutil
+import tempfile
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # DOC base URL
@@ -32,6 +36,16 @@ DOC_BASE_URL = "https://www.doc.govt.nz"
 # Output directory for raw downloads
 OUTPUT_DIR = Path(__file__).parent.parent / "data" / "raw-nz"
 
+# Concurrent downloads (network-bound, so threads overlap the waiting)
+DOWNLOAD_WORKERS = 8
+
+# mkstemp creates files 0600; downloads get the usual umask-derived mode instead.
+# Read once at import - os.umask() can only be queried by setting it, which
+# isn't safe once download threads are running.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+DOWNLOAD_FILE_MODE = 0o666 & ~_UMASK
+
 # Complete NZ bird species catalog from DOC
 # Uses official eBird 6-character codes from eBird/Clements v2025 taxonomy
 # Format: ebird_code -> {common_name, maori_name (optional), files: [{url, voc_type}]}
@@ -332,16 +346,28 @@ NZ_SPECIES = {
 
 
 def download_file(url: str, output_path: Path) -> bool:
-    """Download a file from URL."""
+    """
+    Download a file from URL.
+
+    Writes to a temp file in the output directory and renames it into place
+    once complete, so an interrupted download never leaves a truncated MP3
+    that the next run would skip as already downloaded.
+    """
+    tmp_fd, tmp_path = tempfile.mkstemp(suffix='.part', dir=output_path.parent)
     try:
         full_url = DOC_BASE_URL + url if url.startswith('/') else url
         req = urllib.request.Request(full_url, headers={'User-Agent': 'ChipNotes-NZ/1.0'})
-        with urllib.request.urlopen(req, timeout=60) as response:
-            output_path.write_bytes(response.read())
+        with os.fdopen(tmp_fd, 'wb') as f, urllib.request.urlopen(req, timeout=60) as response:
+            shutil.copyfileobj(response, f, length=64 * 1024)
+        os.chmod(tmp_path, DOWNLOAD_FILE_MODE)
+        os.replace(tmp_path, output_path)
         return True
     except Exception as e:
         print(f"    Download failed: {e}")
         return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
 
 
 def main():
@@ -368,6 +394,7 @@ def main():
 
     total_files = 0
     skipped = 0
+    downloads = []
 
     for species_code, info in species_to_download.items():
         common_name = info['common_name']
@@ -392,11 +419,24 @@ def main():
                 skipped += 1
                 continue
 
-            print(f"  Downloading: {filename}...")
-            if download_file(url, output_path):
-                total_files += 1
-            else:
-                print(f"  FAILED: {filename}")
+            print(f"  Queued: {filename}")
+            downloads.append((url, output_path))
+
+    if downloads:
+        print()
+        print(f"Downloading {len(downloads)} files ({DOWNLOAD_WORKERS} at a time)...")
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(download_file, url, output_path): output_path.name
+                for url, output_path in downloads
+            }
+            for future in as_completed(futures):
+                filename = futures[future]
+                if future.result():
+                    total_files += 1
+                    print(f"  Downloaded: {filename}")
+                else:
+                    print(f"  FAILED: {filename}")
 
     print()
     print(f"Downloaded: {total_files} files")
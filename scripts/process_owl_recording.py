@@ -3,13 +3,13 @@
 Process owl recording: find hoots, extract separate 3-second clips.
 """
 
+import functools
 import numpy as np
 from scipy.io import wavfile
 from scipy import signal
 from scipy.ndimage import uniform_filter1d
 import os
 import subprocess
-import hashlib
 
 
 def find_hoots(audio, sr, min_freq=200, max_freq=800,
@@ -50,15 +50,15 @@ def find_hoots(audio, sr, min_freq=200, max_freq=800,
     if len(starts) > len(ends):
         starts = starts[:len(ends)]
 
-    # Filter by duration
+    # Filter by duration (all regions at once)
     min_samples = int(min_duration * sr)
-    hoots = []
-    for start, end in zip(starts, ends):
-        duration = end - start
-        if duration >= min_samples:
-            # Add some padding
-            pad = int(0.1 * sr)
-            hoots.append((max(0, start - pad), min(len(audio), end + pad)))
+    keep = (ends - starts) >= min_samples
+
+    # Add some padding
+    pad = int(0.1 * sr)
+    hoot_starts = np.maximum(starts[keep] - pad, 0)
+    hoot_ends = np.minimum(ends[keep] + pad, len(audio))
+    hoots = list(zip(hoot_starts.tolist(), hoot_ends.tolist()))
 
     # Merge hoots that are very close together (within min_gap)
     min_gap_samples = int(min_gap * sr)
@@ -136,6 +136,19 @@ def extract_clip(audio, sr, center_sample, target_duration=3.0):
     return clip
 
 
+@functools.lru_cache(maxsize=4)
+def fade_ramps(fade_samples):
+    """
+    Fade-in/fade-out ramps of a given length, built once and shared
+    between clips (read-only so a caller can't corrupt the cache).
+    """
+    fade_in = np.linspace(0, 1, fade_samples)
+    fade_out = np.linspace(1, 0, fade_samples)
+    fade_in.setflags(write=False)
+    fade_out.setflags(write=False)
+    return fade_in, fade_out
+
+
 def normalize_and_fade(audio, sr):
     """
     Normalize to reasonable level and apply fade in/out.
@@ -147,8 +160,7 @@ def normalize_and_fade(audio, sr):
 
     # Apply fade in/out
     fade_samples = int(0.05 * sr)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
+    fade_in, fade_out = fade_ramps(fade_samples)
     audio[:fade_samples] *= fade_in
     audio[-fade_samples:] *= fade_out
 
@@ -157,7 +169,8 @@ def normalize_and_fade(audio, sr):
 
 def generate_clip_id():
     """Generate a short random ID."""
-    return hashlib.md5(os.urandom(16)).hexdigest()[:8]
+    # 4 random bytes = 8 hex chars, same 32-bit ID space as the old md5(urandom)[:8]
+    return os.urandom(4).hex()
 
 
 def process_recording(input_path, output_dir, base_name, target_duration=3.0):
@@ -7,86 +7,31 @@ Usage:
     python scripts/scan_new_clips.py
 """
 
+import csv
 import json
 import os
 import re
 from pathlib import Path
 
-# Species data for warblers
-WARBLER_SPECIES = {
-    'BWWA': 'Blue-winged Warbler',
-    'GWWA': 'Golden-winged Warbler',
-    'TEWA': 'Tennessee Warbler',
-    'OCWA': 'Orange-crowned Warbler',
-    'NAWA': 'Nashville Warbler',
-    'NOPA': 'Northern Parula',
-    'MAWA': 'Magnolia Warbler',
-    'CMWA': 'Cape May Warbler',
-    'BTBW': 'Black-throated Blue Warbler',
-    'YRWA': 'Yellow-rumped Warbler',
-    'BLBW': 'Blackburnian Warbler',
-    'BLPW': 'Blackpoll Warbler',
-    'BTNW': 'Black-throated Green Warbler',
-    'CSWA': 'Chestnut-sided Warbler',
-    'BBWA': 'Bay-breasted Warbler',
-    'PRAW': 'Prairie Warbler',
-    'PAWA': 'Palm Warbler',
-    'PIWA': 'Pine Warbler',
-    'YTWA': 'Yellow-throated Warbler',
-    'PROW': 'Prothonotary Warbler',
-    'COYE': 'Common Yellowthroat',
-    'CAWA': 'Canada Warbler',
-    'WIWA': "Wilson's Warbler",
-    'AMRE': 'American Redstart',
-    'OVEN': 'Ovenbird',
-    'NOWA': 'Northern Waterthrush',
-    'LOWA': 'Louisiana Waterthrush',
-    'BAWW': 'Black-and-white Warbler',
-    'CONW': 'Connecticut Warbler',
-    'MOWA': 'Mourning Warbler',
-    'KEWA': 'Kentucky Warbler',
-    'HOWA': 'Hooded Warbler',
-    'SWWA': "Swainson's Warbler",
-    'YEWA': 'Yellow Warbler',
-}
-
-# All species (combine with existing)
-ALL_SPECIES = {
-    'NOCA': 'Northern Cardinal',
-    'CAWR': 'Carolina Wren',
-    'BLJA': 'Blue Jay',
-    'AMCR': 'American Crow',
-    'TUTI': 'Tufted Titmouse',
-    'AMRO': 'American Robin',
-    'AMGO': 'American Goldfinch',
-    'MODO': 'Mourning Dove',
-    'HOFI': 'House Finch',
-    'WBNU': 'White-breasted Nuthatch',
-    'BHNU': 'Brown-headed Nuthatch',
-    'EABL': 'Eastern Bluebird',
-    'GRCA': 'Gray Catbird',
-    'CACH': 'Carolina Chickadee',
-    'BRCR': 'Brown Creeper',
-    'BRTH': 'Brown Thrasher',
-    'HETH': 'Hermit Thrush',
-    'RSHA': 'Red-shouldered Hawk',
-    'BEKI': 'Belted Kingfisher',
-    'DOWO': 'Downy Woodpecker',
-    'HAWO': 'Hairy Woodpecker',
-    'RBWO': 'Red-bellied Woodpecker',
-    'PIWO': 'Pileated Woodpecker',
-    'YBSA': 'Yellow-bellied Sapsucker',
-    'NOFL': 'Northern Flicker',
-    'RHWO': 'Red-headed Woodpecker',
-    'SOSP': 'Song Sparrow',
-    'WTSP': 'White-throated Sparrow',
-    'CHSP': 'Chipping Sparrow',
-    'SWSP': 'Swamp Sparrow',
-    'FISP': 'Field Sparrow',
-    'SASP': 'Savannah Sparrow',
-    'LISP': "Lincoln's Sparrow",
-    **WARBLER_SPECIES
-}
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Single source of truth for species codes and names (same CSV the audit
+# scripts validate against)
+TAXONOMY_CSV = Path(__file__).resolve().parent.parent / 'docs' / 'IBP-AOS-list25.csv'
+
+
+def load_species_names():
+    """Load {SPEC code: common name} from the taxonomy CSV"""
+    with open(TAXONOMY_CSV, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        spec_idx = header.index('SPEC')
+        name_idx = header.index('COMMONNAME')
+        return {row[spec_idx].strip(): row[name_idx].strip()
+                for row in reader if row and row[spec_idx].strip()}
 
 
 def main():
@@ -94,12 +39,17 @@ def main():
     clips_json = Path('data/clips.json')
     output_file = Path('data/new_clips.json')
 
+    species_names = load_species_names()
+
     # Load existing clips.json
     existing_ids = set()
     if clips_json.exists():
-        with open(clips_json) as f:
-            clips = json.load(f)
-            existing_ids = {c['clip_id'] for c in clips}
+        if orjson is not None:
+            clips = orjson.loads(clips_json.read_bytes())
+        else:
+            with open(clips_json) as f:
+                clips = json.load(f)
+        existing_ids = {c['clip_id'] for c in clips}
         print(f"Loaded {len(existing_ids)} existing clips from clips.json")
     else:
         print("No clips.json found, treating all clips as new")
@@ -108,8 +58,14 @@ def main():
     new_clips = []
     pattern = re.compile(r'^([A-Z]{4})_(\d+)\.wav$')
 
-    for wav_file in sorted(clips_dir.glob('*.wav')):
-        match = pattern.match(wav_file.name)
+    # Single scandir pass; the pattern already rejects anything but CODE_ID.wav
+    wav_names = []
+    if clips_dir.is_dir():
+        with os.scandir(clips_dir) as it:
+            wav_names = sorted(e.name for e in it if e.name.endswith('.wav') and e.is_file())
+
+    for wav_name in wav_names:
+        match = pattern.match(wav_name)
         if not match:
             continue
 
@@ -122,15 +78,15 @@ def main():
             continue
 
         # Skip if species not recognized
-        if species_code not in ALL_SPECIES:
-            print(f"  Warning: Unknown species code {species_code} in {wav_file.name}")
+        if species_code not in species_names:
+            print(f"  Warning: Unknown species code {species_code} in {wav_name}")
             continue
 
         new_clips.append({
             'clip_id': clip_id,
             'species_code': species_code,
-            'common_name': ALL_SPECIES[species_code],
-            'file_path': f"clips/{wav_file.name}",
+            'common_name': species_names[species_code],
+            'file_path': f"clips/{wav_name}",
             'vocalization_type': 'song',
             'duration_ms': 3000,  # Standard trimmed length
             'source': 'xeno-canto',
@@ -148,14 +104,17 @@ def main():
         by_species[code].append(clip)
 
     # Write output
-    with open(output_file, 'w') as f:
-        json.dump(new_clips, f, indent=2)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(new_clips, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(new_clips, f, indent=2, ensure_ascii=False)
 
     # Print summary
     print(f"\n=== Found {len(new_clips)} new clips across {len(by_species)} species ===\n")
     for code in sorted(by_species.keys()):
         clips_list = by_species[code]
-        name = ALL_SPECIES.get(code, code)
+        name = species_names.get(code, code)
         print(f"  {code}: {len(clips_list):2d} clips - {name}")
 
     print(f"\nManifest written to: {output_file}")
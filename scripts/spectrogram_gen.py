@@ -80,13 +80,14 @@ def generate_spectrogram(audio_data: np.ndarray, sample_rate: int, output_path:
             scaling='density'
         )
 
-        # Convert to dB scale
-        Sxx_db = 10 * np.log10(Sxx + 1e-10)
-
-        # Filter frequency range
-        freq_mask = (frequencies >= config['freq_min']) & (frequencies <= config['freq_max'])
-        frequencies_filtered = frequencies[freq_mask]
-        Sxx_filtered = Sxx_db[freq_mask, :]
+        # Filter frequency range (frequencies are ascending, so the band is a
+        # contiguous row slice - a view, no boolean mask or fancy-index copy)
+        lo = np.searchsorted(frequencies, config['freq_min'], side='left')
+        hi = np.searchsorted(frequencies, config['freq_max'], side='right')
+        frequencies_filtered = frequencies[lo:hi]
+
+        # Convert to dB scale (only the rows that are displayed)
+        Sxx_filtered = 10 * np.log10(Sxx[lo:hi] + 1e-10)
 
         # Normalize to 0-1 range for consistent display
         vmin = np.percentile(Sxx_filtered, 5)